@@ -6,14 +6,18 @@ the impact of each constraint on solution quality.
 """
 
 import csv
+import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from dataclasses import dataclass
 from typing import Literal
 
-from src.data_models import QUBOParams, CityGraph
+import numpy as np
+
+from src.data_models import QUBOParams, CityGraph, SolverResponse
 from src.simulator import generate_random_city
-from src.d_wave_solver import quantum_solve
+from src.qaoa_solver import quantum_solve_batch
 from src.greedy_solver import greedy_solve
 
 
@@ -94,9 +98,99 @@ class AblationResult:
     quantum_wins: int
 
 
+def _gen_one(args: tuple[int, float, str, int]) -> CityGraph:
+    """Generate one test graph from (n_nodes, priority_ratio, traffic_profile, seed)."""
+    n_nodes, priority_ratio, traffic_profile, seed = args
+    return generate_random_city(
+        n_nodes=n_nodes,
+        priority_ratio=priority_ratio,
+        traffic_profile=traffic_profile,
+        seed=seed
+    )
+
+
+def _solve_graph(
+    work: tuple[int, list[AblationConfig], CityGraph, SolverResponse | None, bool]
+) -> list[tuple]:
+    """
+    Solve one graph for every configuration.
+
+    All configs share the graph's QUBO skeleton and sampler through
+    quantum_solve_batch.
+
+    Args:
+        work: (graph_index, configs, graph, greedy_result, use_mock); a
+            greedy_result of None is computed here
+
+    Returns:
+        One (config_index, feasible, priority_satisfied, distance, time,
+        solve_ms, quantum_win) row per config, or [] if either solver raised.
+    """
+    gi, configs, graph, gr, use_mock = work
+    try:
+        # Greedy baselines are independent of the QUBO params - solved once
+        # per graph, under the same error handling as the quantum solves
+        if gr is None:
+            gr = greedy_solve(graph)
+        quantum_results = quantum_solve_batch(
+            graph,
+            [config.params for config in configs],
+            use_mock=use_mock
+        )
+    except Exception as e:
+        print(f"Error on graph {gi}: {e}")
+        return []
+
+    return [
+        (
+            ci,
+            qr.feasible,
+            qr.priority_satisfied,
+            qr.total_distance,
+            qr.travel_time,
+            qr.solve_time_ms,
+            qr.total_distance < gr.total_distance,
+        )
+        for ci, qr in enumerate(quantum_results)
+    ]
+
+
+def _aggregate_ablation(
+    config: AblationConfig,
+    n: int,
+    rows: list[tuple] | np.ndarray
+) -> AblationResult:
+    """Reduce the _solve_graph rows of one configuration into an AblationResult."""
+    # One (n_rows, 7) float array; boolean columns become 0.0/1.0.
+    # Already-float arrays pass through without a copy.
+    cols = np.asarray(rows, dtype=np.float64).reshape(-1, 7)
+    feasible = cols[:, 1] > 0
+    priority_sat = cols[:, 2] > 0
+    quantum_win = cols[:, 6] > 0
+    distances = cols[feasible, 3]
+    times = cols[feasible, 4]
+    solve_times = cols[:, 5]
+
+    n_feasible = int(feasible.sum())
+    quantum_wins = int((feasible & quantum_win).sum())
+
+    return AblationResult(
+        config=config,
+        n_runs=n,
+        feasibility_rate=n_feasible / n if n > 0 else 0,
+        priority_rate=int(priority_sat.sum()) / n if n > 0 else 0,
+        avg_distance=float(distances.mean()) if distances.size else 0,
+        avg_time=float(times.mean()) if times.size else 0,
+        avg_solve_ms=float(solve_times.mean()) if solve_times.size else 0,
+        greedy_wins=n_feasible - quantum_wins,
+        quantum_wins=quantum_wins
+    )
+
+
 def run_ablation_experiment(
     config: AblationConfig,
     graphs: list[CityGraph],
+    greedy_results: list[SolverResponse],
     use_mock: bool = True
 ) -> AblationResult:
     """
@@ -105,54 +199,18 @@ def run_ablation_experiment(
     Args:
         config: Ablation configuration to test
         graphs: Test graphs
+        greedy_results: greedy_solve result for each graph (same order)
         use_mock: Use mock sampler
         
     Returns:
         AblationResult with aggregated metrics
     """
-    n = len(graphs)
-    feasible = 0
-    priority_sat = 0
-    distances = []
-    times = []
-    solve_times = []
-    greedy_wins = 0
-    quantum_wins = 0
-    
-    for graph in graphs:
-        try:
-            qr = quantum_solve(graph, config.params, use_mock=use_mock)
-            gr = greedy_solve(graph)
-            
-            if qr.feasible:
-                feasible += 1
-                distances.append(qr.total_distance)
-                times.append(qr.travel_time)
-                
-                if qr.total_distance < gr.total_distance:
-                    quantum_wins += 1
-                else:
-                    greedy_wins += 1
-                    
-            if qr.priority_satisfied:
-                priority_sat += 1
-                
-            solve_times.append(qr.solve_time_ms)
-            
-        except Exception as e:
-            print(f"Error in {config.name}: {e}")
-    
-    return AblationResult(
-        config=config,
-        n_runs=n,
-        feasibility_rate=feasible / n if n > 0 else 0,
-        priority_rate=priority_sat / n if n > 0 else 0,
-        avg_distance=sum(distances) / len(distances) if distances else 0,
-        avg_time=sum(times) / len(times) if times else 0,
-        avg_solve_ms=sum(solve_times) / len(solve_times) if solve_times else 0,
-        greedy_wins=greedy_wins,
-        quantum_wins=quantum_wins
-    )
+    rows = [
+        row
+        for gi, (graph, gr) in enumerate(zip(graphs, greedy_results))
+        for row in _solve_graph((gi, [config], graph, gr, use_mock))
+    ]
+    return _aggregate_ablation(config, len(graphs), rows)
 
 
 def run_full_ablation_study(
@@ -161,10 +219,11 @@ def run_full_ablation_study(
     traffic_profile: Literal["low", "mixed", "high"] = "mixed",
     configs: list[AblationConfig] | None = None,
     output_dir: str = "results",
-    use_mock: bool = True
+    use_mock: bool = True,
+    max_workers: int | None = None
 ) -> list[AblationResult]:
     """
-    Run full ablation study across all configurations.
+    Run full ablation study across all configurations on a process pool.
     
     Args:
         n_nodes: Nodes per graph
@@ -173,6 +232,7 @@ def run_full_ablation_study(
         configs: Ablation configurations (defaults to ABLATION_CONFIGS)
         output_dir: Output directory
         use_mock: Use mock sampler
+        max_workers: Worker processes (defaults to os.cpu_count())
         
     Returns:
         List of AblationResult for each configuration
@@ -180,30 +240,39 @@ def run_full_ablation_study(
     if configs is None:
         configs = ABLATION_CONFIGS
     
-    # Generate test graphs
-    print(f"Generating {n_graphs} test graphs with {n_nodes} nodes...")
-    graphs = [
-        generate_random_city(
-            n_nodes=n_nodes,
-            priority_ratio=0.3,
-            traffic_profile=traffic_profile,
-            seed=i * 77
-        )
-        for i in range(n_graphs)
-    ]
-    
-    print(f"\nRunning {len(configs)} ablation configurations...")
-    print("=" * 70)
-    
+    n_workers = max_workers or os.cpu_count() or 1
+
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        # Generate test graphs (each seed is independent)
+        print(f"Generating {n_graphs} test graphs with {n_nodes} nodes...")
+        graphs = list(executor.map(
+            _gen_one,
+            [(n_nodes, 0.3, traffic_profile, i * 77) for i in range(n_graphs)]
+        ))
+
+        print(f"\nRunning {len(configs)} ablation configurations...")
+        print("=" * 70)
+
+        # Sizes are known up front: fill a preallocated (config, graph, column)
+        # table in place and mark which graphs solved without error
+        table = np.empty((len(configs), len(graphs), 7), dtype=np.float64)
+        solved = np.zeros(len(graphs), dtype=bool)
+
+        chunksize = max(1, len(graphs) // (4 * n_workers))
+        work = [(gi, configs, graphs[gi], None, use_mock) for gi in range(len(graphs))]
+        for gi, graph_rows in enumerate(executor.map(_solve_graph, work, chunksize=chunksize)):
+            for row in graph_rows:
+                table[row[0], gi] = row
+            solved[gi] = bool(graph_rows)
+
     results = []
     for i, config in enumerate(configs):
+        result = _aggregate_ablation(config, len(graphs), table[i, solved])
+        results.append(result)
+
         print(f"\n[{i+1}/{len(configs)}] {config.name}")
         print(f"   {config.description}")
         print(f"   A={config.params.A}, B={config.params.B}, Bp={config.params.Bp}, C={config.params.C}")
-        
-        result = run_ablation_experiment(config, graphs, use_mock)
-        results.append(result)
-        
         print(f"   → Feasibility: {result.feasibility_rate*100:.0f}%, Priority: {result.priority_rate*100:.0f}%")
         print(f"   → Quantum wins: {result.quantum_wins}, Greedy wins: {result.greedy_wins}")
     
@@ -212,29 +281,32 @@ def run_full_ablation_study(
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     output_file = f"{output_dir}/ablation_study_{timestamp}.csv"
     
-    with open(output_file, "w", newline="") as f:
+    rows = [
+        (
+            r.config.name,
+            r.config.description,
+            r.config.params.A,
+            r.config.params.B,
+            r.config.params.Bp,
+            r.config.params.C,
+            round(r.feasibility_rate * 100, 1),
+            round(r.priority_rate * 100, 1),
+            round(r.avg_distance, 2),
+            round(r.avg_time, 2),
+            round(r.avg_solve_ms, 1),
+            r.quantum_wins,
+            r.greedy_wins,
+        )
+        for r in results
+    ]
+    with open(output_file, "w", newline="", buffering=1 << 20) as f:
         writer = csv.writer(f)
         writer.writerow([
             "Configuration", "Description", "A", "B", "Bp", "C",
             "Feasibility%", "Priority%", "AvgDistance", "AvgTime",
             "AvgSolveMs", "QuantumWins", "GreedyWins"
         ])
-        for r in results:
-            writer.writerow([
-                r.config.name,
-                r.config.description,
-                r.config.params.A,
-                r.config.params.B,
-                r.config.params.Bp,
-                r.config.params.C,
-                f"{r.feasibility_rate*100:.1f}",
-                f"{r.priority_rate*100:.1f}",
-                f"{r.avg_distance:.2f}",
-                f"{r.avg_time:.2f}",
-                f"{r.avg_solve_ms:.1f}",
-                r.quantum_wins,
-                r.greedy_wins
-            ])
+        writer.writerows(rows)
     
     print("\n" + "=" * 70)
     print(f"Results saved to: {output_file}")
@@ -250,6 +322,8 @@ def print_ablation_summary(results: list[AblationResult]):
     print("\n" + "=" * 70)
     print("ABLATION STUDY SUMMARY")
     print("=" * 70)
+
+    by_name = {r.config.name: r for r in results}
     
     # Find best configurations
     best_feasibility = max(results, key=lambda r: r.feasibility_rate)
@@ -262,15 +336,15 @@ def print_ablation_summary(results: list[AblationResult]):
     print("\n📊 KEY FINDINGS:")
     
     # Compare with vs without priority ordering
-    full = next((r for r in results if r.config.name == "full_model"), None)
-    no_order = next((r for r in results if r.config.name == "no_priority_ordering"), None)
+    full = by_name.get("full_model")
+    no_order = by_name.get("no_priority_ordering")
     if full and no_order:
         diff = full.priority_rate - no_order.priority_rate
         print(f"   → Priority ordering (B) increases priority satisfaction by {diff*100:.0f}%")
     
     # Compare constraint strengths
-    weak = next((r for r in results if r.config.name == "weak_one_hot"), None)
-    strong = next((r for r in results if r.config.name == "strong_one_hot"), None)
+    weak = by_name.get("weak_one_hot")
+    strong = by_name.get("strong_one_hot")
     if weak and strong:
         diff = strong.feasibility_rate - weak.feasibility_rate
         print(f"   → Stronger one-hot (A) changes feasibility by {diff*100:+.0f}%")
@@ -280,30 +354,35 @@ def print_ablation_summary(results: list[AblationResult]):
 
 def generate_ablation_report(results: list[AblationResult]) -> str:
     """Generate markdown report from ablation results."""
-    report = "# Ablation Study Report\n\n"
-    report += f"**Date:** {datetime.now().strftime('%Y-%m-%d %H:%M')}\n"
-    report += f"**Configurations Tested:** {len(results)}\n\n"
-    
-    report += "## Results Table\n\n"
-    report += "| Configuration | A | B | Bp | C | Feasibility | Priority | Q Wins |\n"
-    report += "|---------------|---|---|----|----|-------------|----------|--------|\n"
-    
+    parts = [
+        "# Ablation Study Report\n\n",
+        f"**Date:** {datetime.now().strftime('%Y-%m-%d %H:%M')}\n",
+        f"**Configurations Tested:** {len(results)}\n\n",
+        "## Results Table\n\n",
+        "| Configuration | A | B | Bp | C | Feasibility | Priority | Q Wins |\n",
+        "|---------------|---|---|----|----|-------------|----------|--------|\n",
+    ]
+
     for r in results:
-        report += f"| {r.config.name} | {r.config.params.A} | {r.config.params.B} | "
-        report += f"{r.config.params.Bp} | {r.config.params.C} | "
-        report += f"{r.feasibility_rate*100:.0f}% | {r.priority_rate*100:.0f}% | "
-        report += f"{r.quantum_wins} |\n"
-    
-    report += "\n## Key Insights\n\n"
-    
+        parts.append(
+            f"| {r.config.name} | {r.config.params.A} | {r.config.params.B} | "
+            f"{r.config.params.Bp} | {r.config.params.C} | "
+            f"{r.feasibility_rate*100:.0f}% | {r.priority_rate*100:.0f}% | "
+            f"{r.quantum_wins} |\n"
+        )
+
+    parts.append("\n## Key Insights\n\n")
+
     best = max(results, key=lambda r: r.feasibility_rate + r.priority_rate + r.quantum_wins/10)
-    report += f"**Best Overall Configuration:** `{best.config.name}`\n"
-    report += f"- Parameters: A={best.config.params.A}, B={best.config.params.B}, "
-    report += f"Bp={best.config.params.Bp}, C={best.config.params.C}\n"
-    report += f"- Feasibility: {best.feasibility_rate*100:.0f}%\n"
-    report += f"- Priority Satisfaction: {best.priority_rate*100:.0f}%\n"
-    
-    return report
+    parts.append(f"**Best Overall Configuration:** `{best.config.name}`\n")
+    parts.append(
+        f"- Parameters: A={best.config.params.A}, B={best.config.params.B}, "
+        f"Bp={best.config.params.Bp}, C={best.config.params.C}\n"
+    )
+    parts.append(f"- Feasibility: {best.feasibility_rate*100:.0f}%\n")
+    parts.append(f"- Priority Satisfaction: {best.priority_rate*100:.0f}%\n")
+
+    return "".join(parts)
 
 
 if __name__ == "__main__":
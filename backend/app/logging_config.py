@@ -8,8 +8,10 @@ All log entries include timestamp, log level, and are machine-parseable.
 import logging
 import os
 import sys
+import traceback
 from typing import Any
 
+import orjson
 import structlog
 from structlog.typing import Processor
 
@@ -20,6 +22,65 @@ LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
 # Numeric log level for comparisons
 _configured_level: int = logging.INFO
 
+# Shared processors for both structlog and stdlib integration.
+# set_exc_info is deliberately absent: it only acts on logger.exception(),
+# which is never used; error paths pass the exception as exc_info instead,
+# so every record would otherwise pay for a no-op check.
+_SHARED_PROCESSORS: tuple[Processor, ...] = (
+    structlog.contextvars.merge_contextvars,
+    structlog.processors.add_log_level,
+    structlog.processors.StackInfoRenderer(),
+    structlog.processors.TimeStamper(fmt="iso"),
+)
+
+# Innermost frames kept when rendering exception tracebacks
+_TRACEBACK_LIMIT = 10
+
+
+def _format_exc_info(logger: Any, method_name: str, event_dict: dict) -> dict:
+    """
+    Render exc_info into an "exception" field, keeping only the innermost frames.
+
+    Accepts exc_info as an exception instance (preferred; no sys.exc_info()
+    lookup), a sys.exc_info() tuple, or True. Limiting the traceback caps
+    the formatting cost when an error recurs under load.
+    """
+    exc_info = event_dict.pop("exc_info", None)
+    if not exc_info:
+        return event_dict
+
+    if isinstance(exc_info, BaseException):
+        exc = exc_info
+    elif isinstance(exc_info, tuple):
+        exc = exc_info[1]
+    else:
+        exc = sys.exc_info()[1]
+
+    if exc is not None:
+        event_dict["exception"] = "".join(
+            traceback.format_exception(exc, limit=-_TRACEBACK_LIMIT)
+        )
+    return event_dict
+
+
+# Full structlog chain: shared processors followed by JSON rendering.
+# orjson renders straight to bytes, which BytesLogger writes without a
+# str round-trip.
+_STRUCTLOG_PROCESSORS: tuple[Processor, ...] = _SHARED_PROCESSORS + (
+    _format_exc_info,
+    structlog.processors.JSONRenderer(serializer=orjson.dumps),
+)
+
+# Formatter routing stdlib log records through the same processors,
+# so any stdlib loggers also output JSON
+_FORMATTER = structlog.stdlib.ProcessorFormatter(
+    foreign_pre_chain=list(_SHARED_PROCESSORS),
+    processors=[
+        structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+        structlog.processors.JSONRenderer(),
+    ],
+)
+
 
 def is_debug_enabled() -> bool:
     """Check if DEBUG level logging is enabled."""
@@ -44,38 +105,17 @@ def configure_logging(log_level: str | None = None) -> None:
     numeric_level = getattr(logging, level, logging.INFO)
     _configured_level = numeric_level
 
-    # Shared processors for both structlog and stdlib integration
-    shared_processors: list[Processor] = [
-        structlog.contextvars.merge_contextvars,
-        structlog.processors.add_log_level,
-        structlog.processors.StackInfoRenderer(),
-        structlog.dev.set_exc_info,
-        structlog.processors.TimeStamper(fmt="iso"),
-    ]
-
     # Configure structlog
     structlog.configure(
-        processors=shared_processors + [
-            structlog.processors.JSONRenderer()
-        ],
+        processors=list(_STRUCTLOG_PROCESSORS),
         wrapper_class=structlog.make_filtering_bound_logger(numeric_level),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
+        logger_factory=structlog.BytesLoggerFactory(),
         cache_logger_on_first_use=True,
     )
 
-    # Configure stdlib logging to use structlog formatting
-    # This ensures any stdlib loggers also output JSON
-    formatter = structlog.stdlib.ProcessorFormatter(
-        foreign_pre_chain=shared_processors,
-        processors=[
-            structlog.stdlib.ProcessorFormatter.remove_processors_meta,
-            structlog.processors.JSONRenderer(),
-        ],
-    )
-
     handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(formatter)
+    handler.setFormatter(_FORMATTER)
 
     # Configure root logger
     root_logger = logging.getLogger()
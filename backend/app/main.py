@@ -3,174 +3,110 @@ FastAPI Application for Quantum Priority Router.
 """
 
 import asyncio
-import signal
+import multiprocessing
+import os
 import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
 from functools import partial
-from typing import Set
+from pathlib import Path
 
 from fastapi import FastAPI, HTTPException, Request, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
-from starlette.middleware.base import BaseHTTPMiddleware
 from contextlib import asynccontextmanager
-import json
+import orjson
+from anyio import to_thread
 
-from slowapi.errors import RateLimitExceeded
-
-from src.security import validate_graph_path, DATA_DIR
+from src.security import validate_graph_path, DATA_DIR, GRAPH_NAME_PATTERN
 from src.auth import verify_api_key
-from src.rate_limit import limiter
-from app.logging_config import configure_logging, get_logger, is_debug_enabled
-from app.middleware import RequestContextMiddleware, get_request_id
+from src.rate_limit import RateLimiter
+from app.logging_config import configure_logging, get_logger
+from app.middleware import (
+    UnifiedRequestMiddleware,
+    active_request_count,
+    get_request_id,
+    wait_until_idle,
+)
 
 logger = get_logger(__name__)
 
-# Track active requests for graceful shutdown
-active_requests: Set[asyncio.Task] = set()
+
+class OrjsonResponse(Response):
+    """JSON response rendered with orjson (FastAPI's ORJSONResponse is deprecated)."""
+
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
 shutdown_event = asyncio.Event()
 from src.data_models import (
     CityGraph,
     SolverRequest,
     SolverResponse,
     ComparisonResponse,
-    QUBOParams,
     GenerateCityRequest,
 )
-from src.qaoa_solver import quantum_solve, get_sampler_info, check_solver_health
+from src.qaoa_solver import quantum_solve, check_solver_health
 from src.greedy_solver import greedy_solve, greedy_priority_solve
 from src.metrics import compare_solutions
 from src.simulator import generate_random_city
 from src.config import get_settings
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    """
-    Middleware for structured request/response logging.
-
-    Uses request_id from RequestContextMiddleware and logs:
-    - request_id (UUID)
-    - timestamp (ISO format)
-    - method (HTTP verb)
-    - path (endpoint)
-    - status_code
-    - duration_ms
-    - client_ip
-
-    At DEBUG level, also logs request/response bodies.
-    """
-
-    async def dispatch(self, request: Request, call_next):
-        # Get request_id from RequestContextMiddleware (single source of truth)
-        request_id = getattr(request.state, "request_id", "unknown")
-        start_time = time.perf_counter()
-
-        # Get client IP (handle proxy scenarios)
-        client_ip = request.client.host if request.client else "unknown"
-        forwarded_for = request.headers.get("x-forwarded-for")
-        if forwarded_for:
-            client_ip = forwarded_for.split(",")[0].strip()
-
-        # Log request body at DEBUG level only
-        request_body = None
-        if is_debug_enabled() and request.method in ("POST", "PUT", "PATCH"):
-            try:
-                body_bytes = await request.body()
-                request_body = body_bytes.decode("utf-8")
-                # Reconstruct request body stream for downstream handlers
-                # FastAPI will re-read from the cached body
-            except Exception:
-                request_body = "<unreadable>"
-
-        try:
-            response = await call_next(request)
-            duration_ms = (time.perf_counter() - start_time) * 1000
-
-            # Log the request with all metadata
-            log_data = {
-                "request_id": request_id,
-                "method": request.method,
-                "path": request.url.path,
-                "status_code": response.status_code,
-                "duration_ms": round(duration_ms, 2),
-                "client_ip": client_ip,
-            }
-
-            # Add request body at DEBUG level
-            if request_body:
-                log_data["request_body"] = request_body
-
-            logger.info("request_completed", **log_data)
-
-            # Note: X-Request-ID header is added by RequestContextMiddleware
-            return response
-
-        except Exception as exc:
-            duration_ms = (time.perf_counter() - start_time) * 1000
-            logger.error(
-                "request_failed",
-                request_id=request_id,
-                method=request.method,
-                path=request.url.path,
-                duration_ms=round(duration_ms, 2),
-                client_ip=client_ip,
-                error=str(exc),
-            )
-            raise
-
-
-class RequestTrackingMiddleware(BaseHTTPMiddleware):
-    """
-    Middleware to track active requests for graceful shutdown.
-
-    Adds the current task to active_requests set on request start,
-    removes it on completion. This allows the shutdown handler to
-    wait for all in-flight requests to complete.
-    """
-
-    async def dispatch(self, request: Request, call_next):
-        task = asyncio.current_task()
-        if task is not None:
-            active_requests.add(task)
-        try:
-            response = await call_next(request)
-            return response
-        finally:
-            if task is not None:
-                active_requests.discard(task)
-
-
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     Application lifespan handler with graceful shutdown.
 
-    On startup: Configures logging.
-    On shutdown: Waits for in-flight requests to complete (up to shutdown_timeout).
+    On startup: Configures logging, starts the solver process pool and runs
+    the /health dependency checks.
+    On shutdown: Waits for in-flight requests to complete (up to shutdown_timeout),
+    then shuts the solver pool down.
     """
     # Startup: Configure structured logging
     settings = get_settings()
     configure_logging(settings.log_level)
+    # Solver process pool (see submit_solver). forkserver workers fork from
+    # a clean server that has already imported the solver modules, instead
+    # of inheriting this process's event loop and threads (fork) or
+    # re-importing everything (spawn). Windows has no forkserver, so it
+    # falls back to spawn.
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        mp_context = multiprocessing.get_context("forkserver")
+        mp_context.set_forkserver_preload(["src.qaoa_solver", "src.greedy_solver"])
+    else:
+        mp_context = multiprocessing.get_context("spawn")
+    app.state.solver_pool = ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        mp_context=mp_context
+    )
+    app.state.health_payload = _build_health_payload()
     logger.info("startup", service="quantum-priority-router", log_level=settings.log_level)
     yield
     # Shutdown - wait for in-flight requests
+    in_flight = active_request_count()
     logger.info(
         "shutdown_initiated",
         service="quantum-priority-router",
-        active_requests=len(active_requests)
+        active_requests=in_flight
     )
     shutdown_event.set()
 
-    if active_requests:
+    if in_flight:
         logger.info(
             "waiting_for_requests",
-            active_count=len(active_requests),
+            active_count=in_flight,
             timeout_seconds=settings.shutdown_timeout
         )
         try:
             await asyncio.wait_for(
-                asyncio.gather(*active_requests, return_exceptions=True),
+                wait_until_idle(),
                 timeout=settings.shutdown_timeout
             )
             logger.info("graceful_shutdown_complete", service="quantum-priority-router")
@@ -178,102 +114,123 @@ async def lifespan(app: FastAPI):
             logger.warning(
                 "shutdown_timeout_reached",
                 timeout_seconds=settings.shutdown_timeout,
-                remaining_requests=len(active_requests)
+                remaining_requests=active_request_count()
             )
     else:
         logger.info("shutdown_complete", service="quantum-priority-router", message="No active requests")
 
+    app.state.solver_pool.shutdown(wait=True)
+    # Later calls (e.g. a restarted lifespan-less client) use the default executor
+    app.state.solver_pool = None
+
 
 app = FastAPI(
     title="Quantum Priority Router API",
     description="Quantum-classical hybrid routing optimization for urban logistics",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=OrjsonResponse,
 )
 
 # Middleware configuration
 # Note: Middleware executes in REVERSE order of registration (last added = first to execute)
-# So we add in order: CORS, Logging, RequestContext, RequestTracking
-# Execution order: RequestTracking -> RequestContext -> Logging -> CORS -> Route handler
+# So we add in order: CORS, UnifiedRequest
+# Execution order: UnifiedRequest -> CORS -> Route handler
 settings = get_settings()
 
+# Resolved once at import; these are read on every solver request
+_QAOA_USE_MOCK = settings.qaoa_use_mock
+_SOLVER_TIMEOUT = settings.solver_timeout_seconds
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Explicit whitelists: the API only declares GET/POST routes, and the
+    # frontend sends X-API-Key and JSON bodies
+    allow_methods=["GET", "POST"],
+    allow_headers=["Authorization", "Content-Type", "X-Request-ID", "X-API-Key"],
+    # Let browsers cache preflight results for a day
+    max_age=86400,
 )
 
-# Logging middleware (runs after RequestContextMiddleware sets request_id)
-app.add_middleware(LoggingMiddleware)
+# Request middleware (runs first - request_id, active request tracking, logging)
+app.add_middleware(UnifiedRequestMiddleware)
 
-# Request context middleware (sets request_id for all other middleware)
-app.add_middleware(RequestContextMiddleware)
+# Rate limiting: per-route token buckets keyed by API key. Limits are
+# enforced as route dependencies; exceeding one raises a 429 HTTPException
+# (with Retry-After) rendered by http_exception_handler.
 
-# Request tracking middleware (runs first - tracks active requests for graceful shutdown)
-app.add_middleware(RequestTrackingMiddleware)
-
-# Rate limiting
-app.state.limiter = limiter
 
+def submit_solver(solver_func, *args, **kwargs) -> asyncio.Future:
+    """
+    Submit a synchronous solver call to the solver process pool.
 
-async def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded):
+    Solvers are CPU-bound pure Python, so threads would serialize on the
+    GIL; the pool (like those in experiments.py and ablations.py) runs
+    them in separate processes instead. Falls back to the loop's default
+    executor when the pool has not been started (e.g. the lifespan did not
+    run).
     """
-    Handle rate limit exceeded with proper 429 response and Retry-After header.
-    RFC 6585 recommends including Retry-After header with 429 responses.
+    loop = asyncio.get_running_loop()
+    executor = getattr(app.state, "solver_pool", None)
+    # run_in_executor forwards positional args itself; only keyword args
+    # need a partial. (A closure would not pickle for the process pool.)
+    if kwargs:
+        return loop.run_in_executor(executor, partial(solver_func, *args, **kwargs))
+    return loop.run_in_executor(executor, solver_func, *args)
+
 
-    Note: We use a custom handler instead of slowapi's default because
-    headers_enabled=True causes errors with FastAPI response models.
+async def await_with_timeout(awaitable, timeout: float = _SOLVER_TIMEOUT):
     """
-    request_id = getattr(request.state, "request_id", "unknown")
-    # Approximate retry time: 60 seconds for per-minute rate limits
-    retry_after = 60
-    return JSONResponse(
-        status_code=429,
-        content={
-            "detail": f"Rate limit exceeded: {exc.detail}",
-            "request_id": request_id
-        },
-        headers={"Retry-After": str(retry_after)}
-    )
+    Await solver work under the configured solver timeout.
 
+    The timeout is bound as a default argument so it resolves once, when
+    the function is defined.
 
-app.add_exception_handler(RateLimitExceeded, rate_limit_exceeded_handler)
+    Returns 504 Gateway Timeout if the work exceeds the timeout.
+    """
+    try:
+        return await asyncio.wait_for(awaitable, timeout=timeout)
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            status_code=504,
+            detail=f"Solver request timed out after {timeout} seconds"
+        )
 
 
 async def run_solver_with_timeout(solver_func, *args, **kwargs):
     """
     Run a synchronous solver function with timeout.
 
-    Wraps sync function in executor and applies timeout.
+    Wraps sync function in the solver process pool and applies timeout.
     Returns 504 Gateway Timeout if solver exceeds configured timeout.
     """
-    loop = asyncio.get_event_loop()
-    func = partial(solver_func, *args, **kwargs)
-    try:
-        result = await asyncio.wait_for(
-            loop.run_in_executor(None, func),
-            timeout=settings.solver_timeout_seconds
-        )
-        return result
-    except asyncio.TimeoutError:
-        raise HTTPException(
-            status_code=504,
-            detail=f"Solver request timed out after {settings.solver_timeout_seconds} seconds"
-        )
+    return await await_with_timeout(submit_solver(solver_func, *args, **kwargs))
+
+
+def _request_id_for(request: Request) -> str:
+    """
+    Request ID for an error response.
+
+    Reads the context var set by UnifiedRequestMiddleware. It is not set for
+    excluded paths, and already reset by the time the catch-all handler runs
+    (that handler sits outside the middleware), so fall back to the copy in
+    the request scope state.
+    """
+    return get_request_id() or request.scope.get("state", {}).get("request_id", "unknown")
 
 
 # Exception handlers - sanitize errors before returning to clients
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle Pydantic validation errors with field-specific messages."""
-    request_id = getattr(request.state, "request_id", "unknown")
+    request_id = _request_id_for(request)
     errors = []
     for error in exc.errors():
         field = ".".join(str(loc) for loc in error["loc"])
         errors.append({"field": field, "message": error["msg"]})
-    return JSONResponse(
+    return OrjsonResponse(
         status_code=400,
         content={
             "detail": "Validation error",
@@ -286,21 +243,21 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 @app.exception_handler(StarletteHTTPException)
 async def http_exception_handler(request: Request, exc: StarletteHTTPException):
     """Handle HTTP exceptions with consistent format including request_id."""
-    request_id = getattr(request.state, "request_id", "unknown")
-    return JSONResponse(
+    request_id = _request_id_for(request)
+    return OrjsonResponse(
         status_code=exc.status_code,
         content={
             "detail": exc.detail,
             "request_id": request_id
-        }
+        },
+        headers=exc.headers
     )
 
 
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Catch-all for unexpected errors. Logs full details, returns safe message with request_id."""
-    # Get request_id from middleware (always available via RequestContextMiddleware)
-    request_id = getattr(request.state, "request_id", "unknown")
+    request_id = _request_id_for(request)
 
     logger.error(
         "unhandled_exception",
@@ -309,11 +266,11 @@ async def global_exception_handler(request: Request, exc: Exception):
         path=request.url.path,
         error_type=type(exc).__name__,
         error_message=str(exc),
-        exc_info=True
+        exc_info=exc
     )
 
     # Return safe message with request_id for support reference
-    return JSONResponse(
+    return OrjsonResponse(
         status_code=500,
         content={
             "detail": "An internal error occurred. Please try again later.",
@@ -322,23 +279,14 @@ async def global_exception_handler(request: Request, exc: Exception):
     )
 
 
-@app.get("/health")
-async def health_check():
+def _build_health_payload() -> dict:
     """
-    Health check endpoint with dependency status.
+    Run the dependency checks and build the static part of /health.
 
-    Returns:
-        - status: "healthy" | "degraded" | "unhealthy"
-        - service: service name
-        - timestamp: ISO timestamp
-        - dependencies: list of dependency statuses
+    Dependency status only changes across restarts (Qiskit is either
+    importable or not), so this runs once and the result is reused.
     """
-    from datetime import datetime, timezone
-
-    # Check dependencies
-    solver_health = check_solver_health()
-
-    dependencies = [solver_health]
+    dependencies = [check_solver_health()]
 
     # Determine overall status (worst of all dependencies)
     statuses = [d["status"] for d in dependencies]
@@ -352,13 +300,52 @@ async def health_check():
     return {
         "status": overall_status,
         "service": "quantum-priority-router",
-        "timestamp": datetime.now(timezone.utc).isoformat(),
         "dependencies": dependencies
     }
 
 
-@app.post("/solve", response_model=SolverResponse)
-@limiter.limit(f"{settings.rate_limit_solver_per_minute}/minute")
+# (monotonic time, serialized body) of the last /health response
+_health_cache: tuple[float, bytes] | None = None
+_HEALTH_TTL = 1.0
+
+
+@app.get("/health")
+async def health_check():
+    """
+    Health check endpoint with dependency status.
+
+    The serialized body is reused for up to _HEALTH_TTL seconds, so bursts
+    of probes cost one cache check each; the timestamp is at most that old.
+
+    Returns:
+        - status: "healthy" | "degraded" | "unhealthy"
+        - service: service name
+        - timestamp: ISO timestamp
+        - dependencies: list of dependency statuses
+    """
+    global _health_cache
+
+    now = time.monotonic()
+    if _health_cache is not None and now - _health_cache[0] < _HEALTH_TTL:
+        return Response(content=_health_cache[1], media_type="application/json")
+
+    payload = getattr(app.state, "health_payload", None)
+    if payload is None:
+        payload = app.state.health_payload = _build_health_payload()
+
+    body = orjson.dumps({
+        **payload,
+        "timestamp": datetime.now(timezone.utc),
+    })
+    _health_cache = (now, body)
+    return Response(content=body, media_type="application/json")
+
+
+@app.post(
+    "/solve",
+    response_model=SolverResponse,
+    dependencies=[Depends(RateLimiter(settings.rate_limit_solver_per_minute))],
+)
 async def solve_route(request: Request, solver_request: SolverRequest, _: bool = Depends(verify_api_key)):
     """
     Solve routing problem using specified solver.
@@ -373,7 +360,7 @@ async def solve_route(request: Request, solver_request: SolverRequest, _: bool =
             quantum_solve,
             solver_request.graph,
             solver_request.params,
-            use_mock=settings.qaoa_use_mock
+            use_mock=_QAOA_USE_MOCK
         )
     elif solver_request.solver == "greedy-priority":
         result = await run_solver_with_timeout(
@@ -389,29 +376,44 @@ async def solve_route(request: Request, solver_request: SolverRequest, _: bool =
     return result
 
 
-@app.post("/compare", response_model=ComparisonResponse)
-@limiter.limit(f"{settings.rate_limit_solver_per_minute}/minute")
+@app.post(
+    "/compare",
+    response_model=ComparisonResponse,
+    dependencies=[Depends(RateLimiter(settings.rate_limit_solver_per_minute))],
+)
 async def compare_solvers(request: Request, graph: CityGraph, _: bool = Depends(verify_api_key)):
     """
     Run both quantum and greedy solvers and compare results.
 
-    Returns 504 Gateway Timeout if either solver exceeds configured timeout.
+    Both solvers are submitted to the solver pool at once and run in
+    parallel under a single timeout. If either fails or the timeout hits,
+    the other is cancelled so it does not hold a pool slot for a response
+    that will never be sent.
+
+    Returns 504 Gateway Timeout if the solvers exceed the configured timeout.
     """
-    quantum_result = await run_solver_with_timeout(
-        quantum_solve,
-        graph,
-        use_mock=settings.qaoa_use_mock
-    )
-    greedy_result = await run_solver_with_timeout(
-        greedy_solve,
-        graph
+    solver_futures = (
+        submit_solver(quantum_solve, graph, use_mock=_QAOA_USE_MOCK),
+        submit_solver(greedy_solve, graph),
     )
+    try:
+        quantum_result, greedy_result = await await_with_timeout(
+            asyncio.gather(*solver_futures)
+        )
+    except BaseException:
+        # gather() leaves the sibling running when one side raises
+        for future in solver_futures:
+            future.cancel()
+        raise
 
     return compare_solutions(greedy_result, quantum_result)
 
 
-@app.post("/generate-city", response_model=CityGraph)
-@limiter.limit(f"{settings.rate_limit_per_minute}/minute")
+@app.post(
+    "/generate-city",
+    response_model=CityGraph,
+    dependencies=[Depends(RateLimiter(settings.rate_limit_per_minute))],
+)
 async def generate_city(request: Request, city_request: GenerateCityRequest, _: bool = Depends(verify_api_key)):
     """
     Generate a random city graph for testing.
@@ -430,27 +432,84 @@ async def generate_city(request: Request, city_request: GenerateCityRequest, _:
     )
 
 
-@app.get("/graphs")
-@limiter.limit(f"{settings.rate_limit_per_minute}/minute")
+# (DATA_DIR mtime_ns, response payload) for the /graphs listing
+_graphs_cache: tuple[int, dict] | None = None
+# Serializes rebuilds so concurrent misses scan the directory only once
+_graphs_lock = asyncio.Lock()
+
+
+def _scan_graphs() -> list[dict]:
+    """Scan DATA_DIR for servable graph files."""
+    # scandir yields names and file types from the readdir call itself,
+    # avoiding a Path object and stat per entry
+    graphs = []
+    with os.scandir(DATA_DIR) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".json"):
+                continue
+            name = entry.name[:-5]
+            # Only list graphs that get_graph would actually serve
+            if GRAPH_NAME_PATTERN.fullmatch(name) and entry.is_file():
+                graphs.append({
+                    "name": name,
+                    "path": f"/graphs/{name}"
+                })
+    return graphs
+
+
+@app.get(
+    "/graphs",
+    dependencies=[Depends(RateLimiter(settings.rate_limit_per_minute))],
+)
 async def list_graphs(request: Request, _: bool = Depends(verify_api_key)):
     """
     List available sample city graphs.
+
+    The listing is cached until the data directory's mtime changes. On a
+    miss the directory is scanned in a worker thread; the lock makes
+    concurrent misses wait for that one rebuild instead of rescanning.
     """
-    graphs = []
+    global _graphs_cache
 
-    if DATA_DIR.exists():
-        for filepath in DATA_DIR.iterdir():
-            if filepath.suffix == ".json":
-                graphs.append({
-                    "name": filepath.stem,
-                    "path": f"/graphs/{filepath.stem}"
-                })
+    try:
+        mtime_ns = DATA_DIR.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {"graphs": []}
+
+    if _graphs_cache is not None and _graphs_cache[0] == mtime_ns:
+        return _graphs_cache[1]
 
-    return {"graphs": graphs}
+    async with _graphs_lock:
+        # Another request may have rebuilt the listing while we waited
+        if _graphs_cache is not None and _graphs_cache[0] == mtime_ns:
+            return _graphs_cache[1]
 
+        graphs = await to_thread.run_sync(_scan_graphs)
+        payload = {"graphs": graphs}
+        _graphs_cache = (mtime_ns, payload)
 
-@app.get("/graphs/{graph_name}")
-@limiter.limit(f"{settings.rate_limit_per_minute}/minute")
+    return payload
+
+
+# filepath -> (mtime_ns, compact JSON bytes) for served sample graphs, in
+# least- to most-recently used order, capped at _GRAPH_BYTES_CACHE_SIZE entries
+_graph_bytes_cache: OrderedDict[Path, tuple[int, bytes]] = OrderedDict()
+_GRAPH_BYTES_CACHE_SIZE = 64
+
+
+def _load_graph_bytes(filepath: Path) -> bytes:
+    """
+    Load a sample graph file as compact JSON bytes.
+
+    Blocking file read plus orjson parse/serialize; run off the event loop.
+    """
+    return orjson.dumps(orjson.loads(filepath.read_bytes()))
+
+
+@app.get(
+    "/graphs/{graph_name}",
+    dependencies=[Depends(RateLimiter(settings.rate_limit_per_minute))],
+)
 async def get_graph(request: Request, graph_name: str, _: bool = Depends(verify_api_key)):
     """
     Get a specific sample city graph.
@@ -463,13 +522,32 @@ async def get_graph(request: Request, graph_name: str, _: bool = Depends(verify_
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-    if not filepath.exists():
+    # One stat per request: detects deletion, and the mtime keys the cache
+    # so an edited file is re-read
+    try:
+        mtime_ns = filepath.stat().st_mtime_ns
+    except FileNotFoundError:
+        _graph_bytes_cache.pop(filepath, None)
         raise HTTPException(status_code=404, detail="Graph not found")
 
-    with open(filepath, "r") as f:
-        data = json.load(f)
-
-    return data
+    cached = _graph_bytes_cache.get(filepath)
+    if cached is not None and cached[0] == mtime_ns:
+        content = cached[1]
+        _graph_bytes_cache.move_to_end(filepath)
+    else:
+        # Miss: read and parse in a worker thread so the loop keeps serving
+        try:
+            content = await to_thread.run_sync(_load_graph_bytes, filepath)
+        except FileNotFoundError:
+            # Removed between the stat and the read
+            _graph_bytes_cache.pop(filepath, None)
+            raise HTTPException(status_code=404, detail="Graph not found")
+        _graph_bytes_cache[filepath] = (mtime_ns, content)
+        _graph_bytes_cache.move_to_end(filepath)
+        if len(_graph_bytes_cache) > _GRAPH_BYTES_CACHE_SIZE:
+            _graph_bytes_cache.popitem(last=False)
+
+    return Response(content=content, media_type="application/json")
 
 
 if __name__ == "__main__":
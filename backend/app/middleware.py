@@ -1,52 +1,202 @@
 """
 Request context middleware for correlation IDs and request tracking.
 """
-import uuid
+import asyncio
+import os
 import time
 from contextvars import ContextVar
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.logging_config import get_logger, is_debug_enabled
+
+logger = get_logger(__name__)
 
 # Context variable for request ID (accessible anywhere in async context)
 _request_id_ctx: ContextVar[str | None] = ContextVar("request_id", default=None)
 
+# Liveness probes and API docs: hit often, never logged or tracked, so the
+# request middleware passes them straight through
+EXCLUDED_PATHS = frozenset({"/health", "/openapi.json", "/docs", "/redoc", "/favicon.ico"})
+
+# Methods whose request bodies are logged at DEBUG level
+_BODY_METHODS = frozenset({"POST", "PUT", "PATCH"})
+
+# Count of in-flight requests for graceful shutdown; shutdown only needs
+# the count and a wake-up, not the tasks themselves. The event is set
+# whenever the count is zero.
+_active_count: int = 0
+_idle_event = asyncio.Event()
+_idle_event.set()
+
 
 def get_request_id() -> str | None:
     """Get current request ID from context."""
     return _request_id_ctx.get()
 
 
-class RequestContextMiddleware(BaseHTTPMiddleware):
+def active_request_count() -> int:
+    """Number of tracked requests currently in flight."""
+    return _active_count
+
+
+async def wait_until_idle() -> None:
+    """Wait until no tracked requests are in flight."""
+    while _active_count:
+        await _idle_event.wait()
+
+
+async def _buffer_request_body(receive: Receive) -> tuple[bytes, Receive]:
     """
-    Middleware that assigns a unique request ID to each request.
+    Read the full request body and return it with a receive that replays it.
 
-    - Generates UUID for each request (or uses incoming X-Request-ID header)
-    - Stores in request.state.request_id
-    - Sets context variable for access anywhere in async context
-    - Adds X-Request-ID response header
+    Downstream handlers read the body from the returned receive callable,
+    so consuming it here for logging does not starve them.
     """
+    chunks = []
+    more_body = True
+    while more_body:
+        message = await receive()
+        if message["type"] != "http.request":
+            # Client disconnected before sending the whole body
+            break
+        chunks.append(message.get("body", b""))
+        more_body = message.get("more_body", False)
+    body = b"".join(chunks)
 
-    async def dispatch(self, request: Request, call_next) -> Response:
-        # Generate or extract request ID (support distributed tracing)
-        request_id = request.headers.get("X-Request-ID") or str(uuid.uuid4())
+    replayed = False
+
+    async def replay_receive() -> Message:
+        nonlocal replayed
+        if not replayed:
+            replayed = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        return await receive()
+
+    return body, replay_receive
+
+
+class UnifiedRequestMiddleware:
+    """
+    Per-request context, tracking and logging in a single ASGI middleware.
+
+    For every HTTP request:
+    - Assigns a request ID (random 128-bit hex, or the incoming
+      X-Request-ID header), stores it in request.state.request_id and
+      adds it as the X-Request-ID response header
+    - Sets the request ID context variable for logging anywhere in the
+      async context
+    - Counts the request as in flight so shutdown can wait for it
+    - Logs request_completed (or request_failed) with request_id, method,
+      path, status_code, duration_ms and client_ip; at DEBUG level the
+      request body is logged too
+
+    Paths in EXCLUDED_PATHS still get a request ID header but are neither
+    tracked nor logged. Doing all of this in one plain ASGI layer shares
+    the header scan and timing, and costs one middleware hop per request.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+
+        # One pass over the raw headers; ASGI header names are lowercase
+        # bytes, so plain comparisons suffice
+        request_id = None
+        forwarded_for = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                request_id = value.decode("latin-1")
+            elif name == b"x-forwarded-for":
+                forwarded_for = value
+        if not request_id:
+            # Same 128 bits of entropy as uuid4, without building a UUID object
+            request_id = os.urandom(16).hex()
 
         # Store in request state (for handlers)
-        request.state.request_id = request_id
+        state = scope.setdefault("state", {})
+        state["request_id"] = request_id
+        state["start_time"] = time.time()
 
-        # Store in context var (for logging anywhere)
-        token = _request_id_ctx.set(request_id)
+        status_code = 500
 
-        # Record timing
-        request.state.start_time = time.time()
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Add request ID to response headers
+                MutableHeaders(scope=message)["X-Request-ID"] = request_id
+            await send(message)
 
-        try:
-            response = await call_next(request)
+        path = scope["path"]
+        if path in EXCLUDED_PATHS:
+            await self.app(scope, receive, send_wrapper)
+            return
+
+        method = scope["method"]
 
-            # Add request ID to response headers
-            response.headers["X-Request-ID"] = request_id
+        # Get client IP (handle proxy scenarios)
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
+        if forwarded_for:
+            first_hop = forwarded_for.split(b",", 1)[0].strip()
+            if first_hop:
+                client_ip = first_hop.decode("latin-1")
 
-            return response
+        # Log request body at DEBUG level only
+        request_body = None
+        if method in _BODY_METHODS and is_debug_enabled():
+            body_bytes, receive = await _buffer_request_body(receive)
+            try:
+                request_body = body_bytes.decode("utf-8")
+            except UnicodeDecodeError:
+                request_body = "<unreadable>"
+
+        global _active_count
+        _active_count += 1
+        _idle_event.clear()
+        # Store in context var (for logging anywhere)
+        token = _request_id_ctx.set(request_id)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as exc:
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            logger.error(
+                "request_failed",
+                request_id=request_id,
+                method=method,
+                path=path,
+                duration_ms=round(duration_ms, 2),
+                client_ip=client_ip,
+                error=str(exc),
+            )
+            raise
         finally:
-            # Reset context var
             _request_id_ctx.reset(token)
+            _active_count -= 1
+            if not _active_count:
+                _idle_event.set()
+
+        duration_ms = (time.perf_counter() - start_time) * 1000
+
+        # Log the request with all metadata
+        log_data = {
+            "request_id": request_id,
+            "method": method,
+            "path": path,
+            "status_code": status_code,
+            "duration_ms": round(duration_ms, 2),
+            "client_ip": client_ip,
+        }
+
+        # Add request body at DEBUG level
+        if request_body:
+            log_data["request_body"] = request_body
+
+        logger.info("request_completed", **log_data)
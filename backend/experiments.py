@@ -6,26 +6,180 @@ logging results to CSV for analysis.
 """
 
 import csv
+import hashlib
+import pickle
+import random
+import sys
+import threading
 import time
 import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
-from src.data_models import QUBOParams
-from src.simulator import generate_random_city
+import numpy as np
+import pydantic
+
+from src import data_models, greedy_solver, qubo_builder, simulator
+from src.data_models import CityGraph, NodeType, QUBOParams, SolverResponse
+from src.simulator import experiment_seed, generate_random_city
 from src.greedy_solver import greedy_solve
 from src.qaoa_solver import quantum_solve
 from src.metrics import compute_distance_reduction, compute_time_reduction
 
 
+# Solvers run_experiment can run
+SOLVERS = frozenset({"greedy", "quantum"})
+
+
+def _source_version(*modules) -> str:
+    """
+    Short hash of the given modules' source files.
+
+    Part of every on-disk cache key, so entries written by an older version
+    of the code that produced them are never served.
+    """
+    digest = hashlib.sha256()
+    for module in modules:
+        digest.update(Path(module.__file__).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+# Code versions of the cached graphs and greedy results. Graphs are pickled
+# pydantic models, so the pydantic version is part of their schema too.
+_GRAPH_CACHE_VERSION = f"{_source_version(simulator, data_models)}|pydantic {pydantic.VERSION}"
+_GREEDY_CACHE_VERSION = f"{_source_version(greedy_solver, qubo_builder, data_models)}|pydantic {pydantic.VERSION}"
+
+
+def _load_cached(path: Path) -> Any | None:
+    """
+    Load a pickled cache entry, or None if it is missing or unreadable.
+
+    Entries pickled against model or module definitions that have since
+    changed can fail in many ways (AttributeError, TypeError, pydantic
+    errors, ...); any failure is treated as a cache miss.
+    """
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        return None
+
+
+def _store_cached(path: Path, value: Any) -> None:
+    """Pickle a cache entry; written then renamed, so parallel workers never read a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        pickle.dump(value, f)
+    os.replace(tmp, path)
+
+
+def cached_generate_city(
+    n_nodes: int,
+    priority_ratio: float,
+    traffic_profile: Literal["low", "mixed", "high"],
+    seed: int,
+    cache_dir: str | None = None
+) -> CityGraph:
+    """
+    generate_random_city with the result persisted on disk.
+
+    Generation is deterministic in its arguments, so repeat sweeps over the
+    same seed grid (e.g. while tuning QUBO params) only read the graph back.
+    The key includes a hash of the generator and model source, so a changed
+    generator or schema never reads an old graph.
+
+    Args:
+        n_nodes: Number of nodes in graph
+        priority_ratio: Fraction of priority nodes
+        traffic_profile: Traffic distribution
+        seed: Random seed
+        cache_dir: Directory for the on-disk cache (None to disable)
+
+    Returns:
+        Generated (or cached) CityGraph
+    """
+    path = None
+    if cache_dir is not None:
+        key = f"{_GRAPH_CACHE_VERSION}|{n_nodes}|{priority_ratio}|{traffic_profile}|{seed}"
+        path = Path(cache_dir) / f"{hashlib.sha256(key.encode()).hexdigest()}.pkl"
+        graph = _load_cached(path)
+        if isinstance(graph, CityGraph):
+            return graph
+
+    graph = generate_random_city(
+        n_nodes=n_nodes,
+        priority_ratio=priority_ratio,
+        traffic_profile=traffic_profile,
+        seed=seed
+    )
+    if path is not None:
+        _store_cached(path, graph)
+    return graph
+
+
+# In-process greedy results, keyed by (graph content key, cache_dir)
+_greedy_memory: dict[tuple, SolverResponse] = {}
+_GREEDY_MEMORY_SIZE = 1024
+
+
+def cached_greedy_solve(
+    graph: CityGraph,
+    cache_dir: str | None = None
+) -> tuple[SolverResponse, bool]:
+    """
+    greedy_solve with results cached by graph content, in memory and on disk.
+
+    greedy_solve is deterministic, so results are keyed by graph content and
+    stored as `<sha256>.pkl` under cache_dir; repeat sweeps over the same seed
+    grid then skip the greedy work entirely, even across runs. The key
+    includes a hash of the solver source, so changed solver code is re-run.
+
+    Args:
+        graph: City graph to solve
+        cache_dir: Directory for the on-disk cache (None for memory only)
+
+    Returns:
+        Tuple of (result, cached). When cached is True the result was not
+        computed by this call, and its solve_time_ms is that of the
+        original solve.
+    """
+    key = (graph.content_key(), cache_dir)
+    result = _greedy_memory.get(key)
+    if result is not None:
+        return result, True
+
+    path = None
+    if cache_dir is not None:
+        digest = hashlib.sha256(repr((_GREEDY_CACHE_VERSION, key[0])).encode()).hexdigest()
+        path = Path(cache_dir) / f"{digest}.pkl"
+        result = _load_cached(path)
+
+    cached = isinstance(result, SolverResponse)
+    if not cached:
+        result = greedy_solve(graph)
+        if path is not None:
+            _store_cached(path, result)
+
+    # Bounded memo: drop the oldest entry when full
+    if len(_greedy_memory) >= _GREEDY_MEMORY_SIZE:
+        del _greedy_memory[next(iter(_greedy_memory))]
+    _greedy_memory[key] = result
+    return result, cached
+
+
 def run_experiment(
     n_nodes: int,
     priority_ratio: float,
     traffic_profile: Literal["low", "mixed", "high"],
     seed: int,
     params: QUBOParams | None = None,
-    use_mock: bool = True
+    use_mock: bool = True,
+    greedy_cache_dir: str | None = None,
+    graph_cache_dir: str | None = None,
+    solvers: frozenset[str] = SOLVERS
 ) -> dict:
     """
     Run a single experiment comparing quantum and greedy solvers.
@@ -37,33 +191,46 @@ def run_experiment(
         seed: Random seed for reproducibility
         params: QUBO parameters
         use_mock: Use mock quantum sampler
+        greedy_cache_dir: On-disk cache for greedy results (None for memory only)
+        graph_cache_dir: On-disk cache for generated graphs (None to disable)
+        solvers: Solvers to run; columns of a skipped solver (and the
+            comparison metrics, unless both ran) are None
         
     Returns:
         Dictionary with experiment results
     """
     # Generate city
-    graph = generate_random_city(
+    graph = cached_generate_city(
         n_nodes=n_nodes,
         priority_ratio=priority_ratio,
         traffic_profile=traffic_profile,
-        seed=seed
+        seed=seed,
+        cache_dir=graph_cache_dir
     )
     
     # Count node types
-    n_priority = len([n for n in graph.nodes if n.type.value == "priority"])
+    n_priority = sum(1 for n in graph.nodes if n.type is NodeType.PRIORITY)
     n_normal = n_nodes - n_priority
     
     # Run greedy solver
-    greedy_result = greedy_solve(graph)
+    greedy_result = None
+    greedy_cached = False
+    if "greedy" in solvers:
+        greedy_result, greedy_cached = cached_greedy_solve(graph, greedy_cache_dir)
     
-    # Run quantum solver
-    quantum_result = quantum_solve(graph, params, use_mock=use_mock)
+    # Run quantum solver; the mock sampler breaks ties with its own
+    # generator, seeded per experiment to keep runs reproducible
+    quantum_result = None
+    if "quantum" in solvers:
+        quantum_result = quantum_solve(graph, params, use_mock=use_mock, rng=random.Random(seed))
     
     # Compute metrics
-    distance_reduction = compute_distance_reduction(greedy_result, quantum_result)
-    time_reduction = compute_time_reduction(greedy_result, quantum_result)
+    distance_reduction = time_reduction = None
+    if greedy_result is not None and quantum_result is not None:
+        distance_reduction = compute_distance_reduction(greedy_result, quantum_result)
+        time_reduction = compute_time_reduction(greedy_result, quantum_result)
     
-    return {
+    row = {
         "timestamp": datetime.now().isoformat(),
         "n_nodes": n_nodes,
         "n_priority": n_priority,
@@ -73,24 +240,79 @@ def run_experiment(
         "seed": seed,
         
         # Greedy results
-        "greedy_distance": greedy_result.total_distance,
-        "greedy_time": greedy_result.travel_time,
-        "greedy_solve_ms": greedy_result.solve_time_ms,
-        "greedy_feasible": greedy_result.feasible,
-        "greedy_priority_satisfied": greedy_result.priority_satisfied,
+        **_result_columns("greedy", greedy_result),
         
         # Quantum results
-        "quantum_distance": quantum_result.total_distance,
-        "quantum_time": quantum_result.travel_time,
-        "quantum_solve_ms": quantum_result.solve_time_ms,
-        "quantum_feasible": quantum_result.feasible,
-        "quantum_priority_satisfied": quantum_result.priority_satisfied,
-        "quantum_energy": quantum_result.energy,
+        **_result_columns("quantum", quantum_result),
+        "quantum_energy": quantum_result.energy if quantum_result else None,
         
         # Comparison metrics
         "distance_reduction_pct": distance_reduction,
         "time_reduction_pct": time_reduction,
     }
+    # A cached greedy result was not timed by this run; leave its time blank
+    # rather than report the original solve's
+    if greedy_cached:
+        row["greedy_solve_ms"] = None
+    return row
+
+
+def _result_columns(prefix: str, result: SolverResponse | None) -> dict:
+    """CSV columns for one solver's result (all None if the solver was skipped)."""
+    if result is None:
+        return dict.fromkeys(
+            f"{prefix}_{col}" for col in ("distance", "time", "solve_ms", "feasible", "priority_satisfied")
+        )
+    return {
+        f"{prefix}_distance": result.total_distance,
+        f"{prefix}_time": result.travel_time,
+        f"{prefix}_solve_ms": result.solve_time_ms,
+        f"{prefix}_feasible": result.feasible,
+        f"{prefix}_priority_satisfied": result.priority_satisfied,
+    }
+
+
+class _ThrottledPrinter:
+    """
+    Collects progress lines and writes them to stdout at most every `interval` seconds.
+
+    Keeps a redirected or slow stdout from stalling the result loop with a
+    blocking write per line. Buffered lines are written once the interval
+    has passed since the last write, by a timer if no later line arrives
+    first; call flush() when done.
+    """
+
+    def __init__(self, interval: float = 0.5):
+        self.interval = interval
+        self._lines: list[str] = []
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+
+    def print(self, line: str) -> None:
+        with self._lock:
+            self._lines.append(line)
+            remaining = self.interval - (time.monotonic() - self._last_flush)
+            if remaining <= 0:
+                self._flush_locked()
+            elif self._timer is None:
+                self._timer = threading.Timer(remaining, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._lines:
+            sys.stdout.write("\n".join(self._lines) + "\n")
+            sys.stdout.flush()
+            self._lines.clear()
+        self._last_flush = time.monotonic()
 
 
 def run_experiment_suite(
@@ -99,10 +321,13 @@ def run_experiment_suite(
     runs_per_config: int = 5,
     output_dir: str = "results",
     use_mock: bool = True,
-    params: QUBOParams | None = None
+    params: QUBOParams | None = None,
+    max_workers: int | None = None,
+    use_cache: bool = True,
+    solvers: frozenset[str] = SOLVERS
 ) -> str:
     """
-    Run a full suite of experiments and save results to CSV.
+    Run a full suite of experiments on a process pool and save results to CSV.
     
     Args:
         n_values: List of node counts to test
@@ -111,63 +336,99 @@ def run_experiment_suite(
         output_dir: Directory to save results
         use_mock: Use mock quantum sampler
         params: QUBO parameters
+        max_workers: Worker processes (defaults to os.cpu_count())
+        use_cache: Reuse generated graphs and greedy results cached under
+            output_dir from earlier runs
+        solvers: Solvers to run (the comparison summary needs both)
         
     Returns:
         Path to output CSV file
     """
+    unknown = set(solvers) - SOLVERS
+    if unknown:
+        raise ValueError(f"Unknown solvers: {sorted(unknown)}")
+    solvers = frozenset(solvers)
+
     # Ensure output directory exists
     Path(output_dir).mkdir(exist_ok=True)
     
     # Create output file
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     output_file = os.path.join(output_dir, f"experiment_results_{timestamp}.csv")
+    greedy_cache_dir = os.path.join(output_dir, ".greedy_cache") if use_cache else None
+    graph_cache_dir = os.path.join(output_dir, ".graph_cache") if use_cache else None
     
-    results = []
-    total_experiments = len(n_values) * len(traffic_profiles) * runs_per_config
+    # Every experiment has its own seed and graph, so they are independent
+    # and can run in any order on a process pool
+    jobs = [
+        (n, traffic, run, experiment_seed(n, traffic, run))
+        for n in n_values
+        for traffic in traffic_profiles
+        for run in range(runs_per_config)
+    ]
+    total_experiments = len(jobs)
     
     print(f"Running {total_experiments} experiments...")
     print(f"Output: {output_file}")
     print("-" * 50)
     
-    experiment_num = 0
-    for n in n_values:
-        for traffic in traffic_profiles:
-            for run in range(runs_per_config):
-                experiment_num += 1
-                seed = hash((n, traffic, run)) % (2**31)
-                
-                print(f"[{experiment_num}/{total_experiments}] n={n}, traffic={traffic}, run={run+1}")
+    results = []
+    n_workers = max_workers or os.cpu_count() or 1
+    
+    # Rows are streamed to the CSV as experiments finish (in completion
+    # order), so a crash mid-suite keeps everything written so far. A row
+    # is ~180 bytes, so the 64 KiB buffer already turns several hundred
+    # rows into a single write() syscall; no manual batching is needed.
+    with open(output_file, "w", buffering=1 << 16, newline="") as f, \
+            ProcessPoolExecutor(max_workers=n_workers) as executor:
+        writer = None
+        futures = {
+            executor.submit(
+                run_experiment,
+                n_nodes=n,
+                priority_ratio=0.3,
+                traffic_profile=traffic,
+                seed=seed,
+                params=params,
+                use_mock=use_mock,
+                greedy_cache_dir=greedy_cache_dir,
+                graph_cache_dir=graph_cache_dir,
+                solvers=solvers
+            ): i
+            for i, (n, traffic, run, seed) in enumerate(jobs)
+        }
+        
+        progress = _ThrottledPrinter()
+        try:
+            for experiment_num, future in enumerate(as_completed(futures), start=1):
+                i = futures[future]
+                n, traffic, run, _ = jobs[i]
+                progress.print(f"[{experiment_num}/{total_experiments}] n={n}, traffic={traffic}, run={run+1}")
                 
                 try:
-                    result = run_experiment(
-                        n_nodes=n,
-                        priority_ratio=0.3,
-                        traffic_profile=traffic,
-                        seed=seed,
-                        params=params,
-                        use_mock=use_mock
-                    )
-                    results.append(result)
-                    
-                    print(f"  → Distance reduction: {result['distance_reduction_pct']:.1f}%")
-                    print(f"  → Quantum feasible: {result['quantum_feasible']}")
-                    
+                    result = future.result()
                 except Exception as e:
-                    print(f"  → ERROR: {e}")
-    
-    # Write results to CSV
-    if results:
-        with open(output_file, "w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=results[0].keys())
-            writer.writeheader()
-            writer.writerows(results)
+                    progress.print(f"  → ERROR: {e}")
+                    continue
+                
+                if writer is None:
+                    writer = csv.DictWriter(f, fieldnames=result.keys())
+                    writer.writeheader()
+                writer.writerow(result)
+                results.append(result)
+                if result["distance_reduction_pct"] is not None:
+                    progress.print(f"  → Distance reduction: {result['distance_reduction_pct']:.1f}%")
+                if result["quantum_feasible"] is not None:
+                    progress.print(f"  → Quantum feasible: {result['quantum_feasible']}")
+        finally:
+            progress.flush()
     
     print("-" * 50)
     print(f"Completed {len(results)} experiments")
     print(f"Results saved to: {output_file}")
     
     # Print summary statistics
-    if results:
+    if results and solvers == SOLVERS:
         print_summary(results)
     
     return output_file
@@ -175,38 +436,39 @@ def run_experiment_suite(
 
 def print_summary(results: list[dict]):
     """Print summary statistics from experiment results."""
-    import statistics
+    # One structured array, so grouping and statistics are vectorized
+    arr = np.array(
+        [
+            (r["n_nodes"], r["distance_reduction_pct"], r["quantum_feasible"], r["quantum_priority_satisfied"])
+            for r in results
+        ],
+        dtype=[("n", "i4"), ("dr", "f8"), ("f", "?"), ("p", "?")]
+    )
     
     print("\n📊 SUMMARY STATISTICS")
     print("=" * 50)
     
     # Group by n_nodes
-    by_n = {}
-    for r in results:
-        n = r["n_nodes"]
-        if n not in by_n:
-            by_n[n] = []
-        by_n[n].append(r)
+    n_values, group = np.unique(arr["n"], return_inverse=True)
+    counts = np.bincount(group)
+    avg_dr = np.bincount(group, weights=arr["dr"]) / counts
+    feasible_rate = np.bincount(group, weights=arr["f"]) / counts * 100
+    priority_rate = np.bincount(group, weights=arr["p"]) / counts * 100
     
     print(f"\n{'Nodes':<8} {'Avg DR%':<10} {'Q Feasible':<12} {'Q Priority':<12}")
     print("-" * 42)
     
-    for n in sorted(by_n.keys()):
-        group = by_n[n]
-        dr_values = [r["distance_reduction_pct"] for r in group]
-        feasible_rate = sum(1 for r in group if r["quantum_feasible"]) / len(group) * 100
-        priority_rate = sum(1 for r in group if r["quantum_priority_satisfied"]) / len(group) * 100
-        
-        avg_dr = statistics.mean(dr_values)
-        print(f"{n:<8} {avg_dr:>8.1f}%  {feasible_rate:>10.0f}%  {priority_rate:>10.0f}%")
+    for i, n in enumerate(n_values.tolist()):
+        print(f"{n:<8} {avg_dr[i]:>8.1f}%  {feasible_rate[i]:>10.0f}%  {priority_rate[i]:>10.0f}%")
     
     # Overall stats
     print("\n" + "=" * 50)
-    all_dr = [r["distance_reduction_pct"] for r in results]
-    all_feasible = sum(1 for r in results if r["quantum_feasible"]) / len(results) * 100
-    all_priority = sum(1 for r in results if r["quantum_priority_satisfied"]) / len(results) * 100
+    all_dr = arr["dr"]
+    std_dr = all_dr.std(ddof=1) if all_dr.size > 1 else 0.0
+    all_feasible = arr["f"].mean() * 100
+    all_priority = arr["p"].mean() * 100
     
-    print(f"Overall Distance Reduction: {statistics.mean(all_dr):.1f}% ± {statistics.stdev(all_dr):.1f}%")
+    print(f"Overall Distance Reduction: {all_dr.mean():.1f}% ± {std_dr:.1f}%")
     print(f"Overall Feasibility Rate:   {all_feasible:.1f}%")
     print(f"Overall Priority Rate:      {all_priority:.1f}%")
 
@@ -225,6 +487,12 @@ if __name__ == "__main__":
                         help="Output directory")
     parser.add_argument("--real-quantum", action="store_true",
                         help="Use real D-Wave quantum hardware")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes (defaults to CPU count)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Ignore and skip writing cached graphs and greedy results")
+    parser.add_argument("--solvers", type=str, nargs="+", choices=sorted(SOLVERS),
+                        default=sorted(SOLVERS), help="Solvers to run")
     
     args = parser.parse_args()
     
@@ -233,5 +501,8 @@ if __name__ == "__main__":
         traffic_profiles=args.traffic,
         runs_per_config=args.runs,
         output_dir=args.output,
-        use_mock=not args.real_quantum
+        use_mock=not args.real_quantum,
+        max_workers=args.workers,
+        use_cache=not args.no_cache,
+        solvers=frozenset(args.solvers)
     )
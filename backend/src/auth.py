@@ -9,6 +9,7 @@ Security approach:
 
 import hashlib
 import secrets
+from functools import lru_cache
 from fastapi import Header, HTTPException
 
 
@@ -28,6 +29,17 @@ def hash_api_key(key: str) -> str:
     return hashlib.sha256(key.encode()).hexdigest()
 
 
+@lru_cache(maxsize=256)
+def _hash_cached(key: str) -> str:
+    """
+    hash_api_key memoized for repeat clients.
+
+    Bounded so that a flood of distinct (invalid) keys cannot grow memory;
+    the comparison against the stored hash still runs on every request.
+    """
+    return hash_api_key(key)
+
+
 def verify_api_key(x_api_key: str = Header(..., description="API key for authentication")) -> bool:
     """
     FastAPI dependency to verify API key from X-API-Key header.
@@ -49,7 +61,7 @@ def verify_api_key(x_api_key: str = Header(..., description="API key for authent
     settings = get_settings()
 
     # Hash the provided key
-    provided_hash = hash_api_key(x_api_key)
+    provided_hash = _hash_cached(x_api_key)
 
     # Timing-safe comparison to prevent timing attacks
     if not settings.api_key_hash or not secrets.compare_digest(provided_hash, settings.api_key_hash):
@@ -3,9 +3,12 @@ Data models for the Quantum Priority Router.
 Defines Pydantic models for nodes, edges, graphs, and API request/responses.
 """
 
+import weakref
+
+import numpy as np
 from pydantic import BaseModel, Field, ConfigDict, model_validator
 from enum import Enum
-from typing import Literal
+from typing import Literal, NamedTuple
 
 
 class NodeType(str, Enum):
@@ -24,6 +27,9 @@ class TrafficLevel(str, Enum):
 
 class Node(BaseModel):
     """A node in the city graph representing a delivery location."""
+    # Immutable (and hashable), so lookups cached on CityGraph stay valid
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(..., description="Unique node identifier")
     x: float = Field(..., description="X coordinate")
     y: float = Field(..., description="Y coordinate")
@@ -33,7 +39,7 @@ class Node(BaseModel):
 
 class Edge(BaseModel):
     """An edge connecting two nodes with distance and traffic info."""
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
     from_node: str = Field(..., alias="from", description="Source node ID")
     to_node: str = Field(..., alias="to", description="Target node ID")
@@ -48,6 +54,30 @@ class TrafficMultipliers(BaseModel):
     high: float = 2.0
 
 
+class GraphLookups(NamedTuple):
+    """Derived lookup tables for a CityGraph (matrices are read-only, in node order)."""
+    weights: dict[tuple[str, str], float]  # (from, to) -> traffic-weighted edge cost, both directions
+    legs: dict[tuple[str, str], tuple[float, float]]  # (from, to) -> (distance, weighted), later edges win
+    index: dict[str, int]  # node ID -> row/column
+    priority_ids: frozenset[str]  # IDs of priority nodes
+    coords: np.ndarray  # Nx2 node (x, y)
+    is_priority: np.ndarray  # N bool, node is a priority node
+    is_normal: np.ndarray  # N bool, node is a normal node
+    euclid: np.ndarray  # NxN straight-line distances
+    dist: np.ndarray  # NxN edge distance, Euclidean where no edge
+    time: np.ndarray  # NxN traffic-weighted time, Euclidean where no edge
+    # Edges as parallel arrays (structure of arrays), in edge order
+    edge_src: np.ndarray  # row of from_node, -1 if unknown
+    edge_dst: np.ndarray  # row of to_node, -1 if unknown
+    edge_distances: np.ndarray  # base distance
+    edge_times: np.ndarray  # traffic-weighted time
+
+
+# CityGraph lookup tables by id(graph): (edges, nodes, multipliers, GraphLookups),
+# each entry removed by a weakref finalizer when its graph is collected
+_graph_lookups: dict[int, tuple] = {}
+
+
 class CityGraph(BaseModel):
     """Complete city graph with nodes, edges, and traffic configuration."""
     nodes: list[Node] = Field(..., min_length=2)
@@ -85,21 +115,151 @@ class CityGraph(BaseModel):
             raise ValueError(f"At most 1 depot node allowed, found {depot_count}")
         return self
 
+    def content_key(self) -> tuple:
+        """
+        Immutable key covering everything the solvers read from this graph.
+
+        Node labels are left out as they do not affect any solver.
+
+        Returns:
+            Hashable tuple of nodes, edges and traffic multipliers
+        """
+        return (
+            tuple((n.id, n.x, n.y, n.type.value) for n in self.nodes),
+            tuple((e.from_node, e.to_node, e.distance, e.traffic.value) for e in self.edges),
+            tuple(sorted(self.traffic_multipliers.items())),
+        )
+
+    @classmethod
+    def from_content_key(cls, key: tuple) -> "CityGraph":
+        """
+        Rebuild a graph from a key produced by content_key.
+
+        Args:
+            key: Output of CityGraph.content_key
+
+        Returns:
+            CityGraph equal to the original apart from node labels
+        """
+        nodes, edges, multipliers = key
+        return cls(
+            nodes=[Node(id=i, x=x, y=y, type=t) for i, x, y, t in nodes],
+            edges=[Edge(from_node=a, to_node=b, distance=d, traffic=t) for a, b, d, t in edges],
+            traffic_multipliers=dict(multipliers),
+        )
+
+    def _build_lookup_tables(self) -> tuple:
+        """GraphLookups, prefixed with the edges, nodes and multipliers they were built from."""
+        index: dict[str, int] = {}
+        for i, n in enumerate(self.nodes):
+            index.setdefault(n.id, i)
+        priority_ids = frozenset(n.id for n in self.nodes if n.type is NodeType.PRIORITY)
+        is_priority = np.array([n.type is NodeType.PRIORITY for n in self.nodes], dtype=bool)
+        is_normal = np.array([n.type is NodeType.NORMAL for n in self.nodes], dtype=bool)
+
+        # One pass over the edge objects into parallel arrays; each traffic
+        # level's multiplier is resolved once rather than per edge
+        multipliers = {
+            level: self.traffic_multipliers.get(level.value, 1.0) for level in TrafficLevel
+        }
+        n_edges = len(self.edges)
+        edge_src = np.empty(n_edges, dtype=np.intp)
+        edge_dst = np.empty(n_edges, dtype=np.intp)
+        edge_distances = np.empty(n_edges, dtype=np.float64)
+        edge_multipliers = np.empty(n_edges, dtype=np.float64)
+        weights: dict[tuple[str, str], float] = {}
+        legs: dict[tuple[str, str], tuple[float, float]] = {}
+        for e, edge in enumerate(self.edges):
+            multiplier = multipliers[edge.traffic]
+            weighted = edge.distance * multiplier
+            edge_src[e] = index.get(edge.from_node, -1)
+            edge_dst[e] = index.get(edge.to_node, -1)
+            edge_distances[e] = edge.distance
+            edge_multipliers[e] = multiplier
+            # First matching edge wins, as in a linear scan
+            weights.setdefault((edge.from_node, edge.to_node), weighted)
+            weights.setdefault((edge.to_node, edge.from_node), weighted)
+            legs[(edge.from_node, edge.to_node)] = legs[(edge.to_node, edge.from_node)] = (edge.distance, weighted)
+        edge_times = edge_distances * edge_multipliers
+
+        coords = np.array([(n.x, n.y) for n in self.nodes], dtype=np.float64)
+        euclid = np.sqrt(((coords[:, None, :] - coords[None, :, :]) ** 2).sum(-1))
+
+        # Dense cost matrices: edges in both directions (a later duplicate
+        # edge overrides an earlier one), Euclidean fallback elsewhere
+        known = np.flatnonzero((edge_src >= 0) & (edge_dst >= 0))
+        rows = np.stack([edge_src[known], edge_dst[known]], axis=1).ravel()
+        cols = np.stack([edge_dst[known], edge_src[known]], axis=1).ravel()
+        # Keep only the last write to each cell, as the sequential loop would
+        cells = rows * len(self.nodes) + cols
+        _, last_from_end = np.unique(cells[::-1], return_index=True)
+        last = len(cells) - 1 - last_from_end
+        dist = euclid.copy()
+        time = euclid.copy()
+        dist[rows[last], cols[last]] = np.repeat(edge_distances[known], 2)[last]
+        time[rows[last], cols[last]] = np.repeat(edge_times[known], 2)[last]
+        np.fill_diagonal(dist, 0.0)
+        np.fill_diagonal(time, 0.0)
+
+        for array in (coords, is_priority, is_normal, euclid, dist, time,
+                      edge_src, edge_dst, edge_distances, edge_times):
+            array.flags.writeable = False
+
+        return (
+            list(self.edges), list(self.nodes), dict(self.traffic_multipliers),
+            GraphLookups(
+                weights, legs, index, priority_ids, coords, is_priority, is_normal,
+                euclid, dist, time,
+                edge_src, edge_dst, edge_distances, edge_times,
+            ),
+        )
+
+    def _lookups(self) -> "GraphLookups":
+        """
+        Lookup tables for this graph, built on first use.
+
+        The tables live in a module-level cache keyed by the graph's id (and
+        dropped when the graph is collected), not in the model's own state,
+        so equality, model_copy and pickling only ever see the declared
+        fields.
+
+        Rebuilt if `edges`, `nodes` or `traffic_multipliers` no longer match
+        what the tables were built from: reassigned, resized, or with an
+        item replaced in place (graph.nodes[i] = ...). The check compares
+        against shallow copies, so unchanged items cost one identity test
+        each. Nodes and edges themselves are frozen, so they cannot change
+        underneath the cache.
+        """
+        key = id(self)
+        cached = _graph_lookups.get(key)
+        if cached is None:
+            weakref.finalize(self, _graph_lookups.pop, key, None)
+        else:
+            edges, nodes, multipliers, lookups = cached
+            if edges == self.edges and nodes == self.nodes and multipliers == self.traffic_multipliers:
+                return lookups
+        cached = _graph_lookups[key] = self._build_lookup_tables()
+        return cached[-1]
+
+    def _euclidean_matrix(self) -> np.ndarray:
+        """Read-only NxN straight-line distances between nodes, in node order."""
+        return self._lookups().euclid
+
     def get_node(self, node_id: str) -> Node | None:
         """Get node by ID."""
-        return next((n for n in self.nodes if n.id == node_id), None)
+        i = self._lookups().index.get(node_id)
+        return self.nodes[i] if i is not None else None
 
     def get_edge_weight(self, from_id: str, to_id: str) -> float:
         """Get traffic-weighted edge distance."""
-        for edge in self.edges:
-            if (edge.from_node == from_id and edge.to_node == to_id) or \
-               (edge.from_node == to_id and edge.to_node == from_id):
-                multiplier = self.traffic_multipliers.get(edge.traffic.value, 1.0)
-                return edge.distance * multiplier
-        # If no direct edge, compute Euclidean distance as fallback
-        n1, n2 = self.get_node(from_id), self.get_node(to_id)
-        if n1 and n2:
-            return ((n1.x - n2.x) ** 2 + (n1.y - n2.y) ** 2) ** 0.5
+        lookups = self._lookups()
+        weight = lookups.weights.get((from_id, to_id))
+        if weight is not None:
+            return weight
+        # If no direct edge, use the Euclidean distance as fallback
+        i, j = lookups.index.get(from_id), lookups.index.get(to_id)
+        if i is not None and j is not None:
+            return float(lookups.euclid[i, j])
         return float('inf')
 
 
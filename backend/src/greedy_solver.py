@@ -6,60 +6,147 @@ Provides two greedy strategies:
 2. greedy_priority_solve: Priority-aware nearest-neighbor — visits all priority
    nodes first, then normal nodes, each phase using nearest-neighbor
 
-Both use O(1) edge lookup for performance.
+Both pick neighbors from dense NumPy cost matrices cached on the graph.
 """
 
 import time
 import math
 
-from .data_models import CityGraph, NodeType, SolverResponse
+import numpy as np
+
+from .data_models import CityGraph, SolverResponse
 from .qubo_builder import (
     count_priority_violations,
     compute_efficiency_ratio,
     improve_route_2opt,
-    _build_edge_lookup,
 )
 
+# Conditional import for Numba (the NumPy walk is used without it)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 
 def euclidean_distance(x1: float, y1: float, x2: float, y2: float) -> float:
     """Compute Euclidean distance between two points."""
-    return math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
+    return math.hypot(x2 - x1, y2 - y1)
 
 
-def _get_weighted_distance(
-    from_id: str,
-    to_id: str,
-    edge_lookup: dict,
-    node_map: dict,
-) -> tuple[float, float]:
-    """Get base distance and traffic-weighted time between two nodes using O(1) lookup."""
-    key = (from_id, to_id)
-    if key in edge_lookup:
-        return edge_lookup[key]
-
-    # Euclidean fallback
-    n1, n2 = node_map.get(from_id), node_map.get(to_id)
-    if n1 and n2:
-        dist = euclidean_distance(n1.x, n1.y, n2.x, n2.y)
-        return dist, dist
-    return float('inf'), float('inf')
-
-
-def _compute_route_cost(
-    route: list[str],
-    edge_lookup: dict,
-    node_map: dict,
+def _nearest_walk_kernel(
+    weighted: np.ndarray,
+    candidates: np.ndarray,
+    current: int,
+    out: np.ndarray,
+) -> tuple[int, int]:
+    """
+    Scalar nearest-neighbor walk, compiled with Numba when available.
+
+    Picks the first minimum on ties, like np.argmin.
+
+    Args:
+        weighted: Weighted time matrix
+        candidates: Boolean mask of nodes still to visit (cleared in place)
+        current: Index of the node the walk starts from
+        out: Buffer receiving the visit order
+
+    Returns:
+        Tuple of (last node visited, number of nodes written to out)
+    """
+    count = 0
+    while True:
+        best = -1
+        best_time = 0.0
+        for j in range(candidates.shape[0]):
+            if candidates[j] and (best < 0 or weighted[current, j] < best_time):
+                best = j
+                best_time = weighted[current, j]
+        if best < 0:
+            return current, count
+        candidates[best] = False
+        out[count] = best
+        count += 1
+        current = best
+
+
+if NUMBA_AVAILABLE:
+    _nearest_walk_kernel = njit(cache=True)(_nearest_walk_kernel)
+
+
+def _visit_nearest(
+    current: int,
+    candidates: np.ndarray,
+    weighted: np.ndarray,
+    order: list[int],
+) -> int:
+    """
+    Nearest-neighbor walk over the candidate nodes, appending to `order`.
+
+    Runs the whole walk in the compiled kernel when Numba is installed,
+    otherwise one np.argmin per step.
+
+    Args:
+        current: Index of the node the walk starts from
+        candidates: Boolean mask of nodes still to visit (cleared in place)
+        weighted: Weighted time matrix
+        order: Visit order (node indices), extended in place
+
+    Returns:
+        Index of the last node visited
+    """
+    if NUMBA_AVAILABLE:
+        out = np.empty(candidates.shape[0], dtype=np.intp)
+        current, count = _nearest_walk_kernel(weighted, candidates, current, out)
+        order.extend(out[:count].tolist())
+        return int(current)
+
+    remaining = np.flatnonzero(candidates)
+    while remaining.size:
+        current = int(remaining[np.argmin(weighted[current, remaining])])
+        order.append(current)
+        candidates[current] = False
+        remaining = np.flatnonzero(candidates)
+    return current
+
+
+def _route_cost(
+    order: list[int],
+    dist: np.ndarray,
+    weighted: np.ndarray,
 ) -> tuple[float, float]:
-    """Compute total distance and travel time for a route."""
-    total_distance = 0.0
-    travel_time = 0.0
-    for i in range(len(route) - 1):
-        dist, weighted = _get_weighted_distance(
-            route[i], route[i + 1], edge_lookup, node_map
-        )
-        total_distance += dist
-        travel_time += weighted
-    return total_distance, travel_time
+    """Total distance and travel time along `order` (node indices)."""
+    steps = (np.array(order[:-1], dtype=np.intp), np.array(order[1:], dtype=np.intp))
+    # Summed left to right in Python, as the legs are taken
+    return sum(dist[steps].tolist()), sum(weighted[steps].tolist())
+
+
+def _check_order(
+    order: list[int],
+    priority_mask: np.ndarray,
+    skip_first: bool,
+) -> tuple[bool, bool]:
+    """
+    Priority and feasibility checks for a visit order.
+
+    Args:
+        order: Visit order (node indices)
+        priority_mask: Boolean mask of priority nodes
+        skip_first: Whether order[0] is the depot (not a delivery position)
+
+    Returns:
+        Tuple of (priority_satisfied, feasible): the first k delivery
+        positions are all priority nodes, and every node is visited once
+    """
+    idx = np.array(order, dtype=np.intp)
+    # The walks clear each node's candidate flag as it is taken and 2-opt
+    # only reverses segments, so orders never repeat a node: full length
+    # means every node was visited once
+    feasible = idx.size == priority_mask.shape[0]
+    k = int(priority_mask.sum())
+    delivery = idx[1:] if skip_first else idx
+    priority_satisfied = bool(priority_mask[delivery[:k]].all()) if k else True
+    return priority_satisfied, bool(feasible)
 
 
 def greedy_solve(graph: CityGraph) -> SolverResponse:
@@ -83,60 +170,28 @@ def greedy_solve(graph: CityGraph) -> SolverResponse:
     start_time = time.time()
 
     nodes = graph.nodes
-    node_map = {n.id: n for n in nodes}
-    edge_lookup = _build_edge_lookup(graph)
-
-    route: list[str] = []
-    total_distance = 0.0
-    travel_time = 0.0
+    # Dense cost matrices cached on the graph: each leg cost is one index
+    lookups = graph._lookups()
+    index, dist, weighted = lookups.index, lookups.dist, lookups.time
 
     # Start from the depot (if present), otherwise the first node
     depot = graph.depot_node
-    unvisited = set(n.id for n in nodes)
-    if depot:
-        unvisited.discard(depot.id)
-        current_id = depot.id
-    else:
-        current_id = nodes[0].id
-        unvisited.discard(current_id)
-    route.append(current_id)
+    current = index[depot.id] if depot else 0
+    unvisited = np.ones(len(nodes), dtype=bool)
+    unvisited[current] = False
+    order = [current]
 
     # Always pick the nearest unvisited node — no priority logic
-    while unvisited:
-        best_id = None
-        best_time = float('inf')
-
-        for cid in unvisited:
-            _, weighted_time = _get_weighted_distance(current_id, cid, edge_lookup, node_map)
-            if weighted_time < best_time:
-                best_time = weighted_time
-                best_id = cid
-
-        if best_id is None:
-            break
-
-        dist, weighted = _get_weighted_distance(current_id, best_id, edge_lookup, node_map)
-        total_distance += dist
-        travel_time += weighted
-        route.append(best_id)
-        current_id = best_id
-        unvisited.discard(best_id)
-
-    solve_time_ms = (time.time() - start_time) * 1000
+    _visit_nearest(current, unvisited, weighted, order)
 
-    # Check if priority nodes ended up first (they usually won't)
-    priority_ids = set(n.id for n in nodes if n.type == NodeType.PRIORITY)
-    k = len(priority_ids)
+    total_distance, travel_time = _route_cost(order, dist, weighted)
+    route = [nodes[i].id for i in order]
 
-    # Priority check: skip depot when evaluating delivery positions
-    delivery_route = route[1:] if depot and route and route[0] == depot.id else route
-    if k > 0:
-        priority_positions = [i for i, node_id in enumerate(delivery_route) if node_id in priority_ids]
-        priority_satisfied = max(priority_positions) < k if priority_positions else False
-    else:
-        priority_satisfied = True
+    solve_time_ms = (time.time() - start_time) * 1000
 
-    feasible = len(route) == len(nodes) and len(set(route)) == len(route)
+    # Check if priority nodes ended up first (they usually won't);
+    # the depot, if any, is skipped as it is not a delivery position
+    priority_satisfied, feasible = _check_order(order, lookups.is_priority, depot is not None)
 
     # Compute evaluation metrics
     rounded_distance = round(total_distance, 2)
@@ -183,80 +238,49 @@ def greedy_priority_solve(graph: CityGraph) -> SolverResponse:
     start_time = time.time()
 
     nodes = graph.nodes
-    node_map = {n.id: n for n in nodes}
-    edge_lookup = _build_edge_lookup(graph)
+    # Dense cost matrices cached on the graph: each leg cost is one index
+    lookups = graph._lookups()
+    index, dist, weighted = lookups.index, lookups.dist, lookups.time
 
     depot = graph.depot_node
-    priority_nodes = {n.id for n in nodes if n.type == NodeType.PRIORITY}
-    normal_nodes = {n.id for n in nodes if n.type == NodeType.NORMAL}
-
-    route: list[str] = []
+    # Node-type masks are cached on the graph; each phase walks its own copy
+    priority_mask = lookups.is_priority
+    is_priority = priority_mask.copy()
+    is_normal = lookups.is_normal.copy()
 
     # Start from depot
     if depot:
-        current_id = depot.id
-        route.append(current_id)
+        current = index[depot.id]
+    elif priority_mask.any():
+        # Start from the priority node nearest to the origin (first on ties)
+        candidates = np.flatnonzero(priority_mask)
+        xy = lookups.coords[candidates]
+        current = int(candidates[np.argmin(xy[:, 0] ** 2 + xy[:, 1] ** 2)])
     else:
-        # Start from the nearest priority node to origin, or first node
-        if priority_nodes:
-            current_id = min(priority_nodes, key=lambda nid: node_map[nid].x ** 2 + node_map[nid].y ** 2)
-        else:
-            current_id = nodes[0].id
-        route.append(current_id)
+        current = 0
+    order = [current]
+
+    # Each phase walks a boolean mask of its own unvisited nodes
+    is_priority[current] = False
+    is_normal[current] = False
 
     # Phase 1: Visit all priority nodes using nearest-neighbor
-    unvisited_priority = set(priority_nodes)
-    if current_id in unvisited_priority:
-        unvisited_priority.discard(current_id)
-
-    while unvisited_priority:
-        best_id = None
-        best_time = float('inf')
-        for cid in unvisited_priority:
-            _, weighted = _get_weighted_distance(current_id, cid, edge_lookup, node_map)
-            if weighted < best_time:
-                best_time = weighted
-                best_id = cid
-        if best_id is None:
-            break
-        route.append(best_id)
-        current_id = best_id
-        unvisited_priority.discard(best_id)
+    current = _visit_nearest(current, is_priority, weighted, order)
 
     # Phase 2: Visit all normal nodes using nearest-neighbor
-    unvisited_normal = set(normal_nodes)
-    while unvisited_normal:
-        best_id = None
-        best_time = float('inf')
-        for cid in unvisited_normal:
-            _, weighted = _get_weighted_distance(current_id, cid, edge_lookup, node_map)
-            if weighted < best_time:
-                best_time = weighted
-                best_id = cid
-        if best_id is None:
-            break
-        route.append(best_id)
-        current_id = best_id
-        unvisited_normal.discard(best_id)
+    _visit_nearest(current, is_normal, weighted, order)
 
     # Phase 3: 2-opt improvement (preserves priority ordering)
-    route = improve_route_2opt(route, graph)
+    route = improve_route_2opt([nodes[i].id for i in order], graph)
 
     # Compute final metrics
-    total_distance, travel_time = _compute_route_cost(route, edge_lookup, node_map)
+    order = [index[nid] for nid in route]
+    total_distance, travel_time = _route_cost(order, dist, weighted)
 
     solve_time_ms = (time.time() - start_time) * 1000
 
     # Priority check
-    k = len(priority_nodes)
-    delivery_route = route[1:] if depot and route and route[0] == depot.id else route
-    if k > 0:
-        priority_positions = [i for i, nid in enumerate(delivery_route) if nid in priority_nodes]
-        priority_satisfied = max(priority_positions) < k if priority_positions else False
-    else:
-        priority_satisfied = True
-
-    feasible = len(route) == len(nodes) and len(set(route)) == len(route)
+    priority_satisfied, feasible = _check_order(order, priority_mask, depot is not None)
     violation_count = count_priority_violations(route, graph)
     rounded_distance = round(total_distance, 2)
     rounded_time = round(travel_time, 2)
@@ -2,9 +2,31 @@
 Metrics computation for routing experiments.
 """
 
+import numpy as np
+
 from .data_models import SolverResponse, ComparisonResponse
 
 
+def reduction_pct(baseline: float, candidate: float) -> float:
+    """
+    Percentage reduction of a candidate value relative to a baseline.
+
+    R = (baseline - candidate) / baseline * 100
+
+    Args:
+        baseline: Reference value (the greedy solution's)
+        candidate: Compared value (the quantum solution's)
+
+    Returns:
+        Positive if the candidate is lower, negative if higher; 0.0 when the
+        baseline is not positive
+    """
+    if baseline <= 0:
+        return 0.0
+
+    return (baseline - candidate) / baseline * 100
+
+
 def compute_distance_reduction(greedy: SolverResponse, quantum: SolverResponse) -> float:
     """
     Compute percentage distance reduction of quantum vs greedy.
@@ -13,20 +35,14 @@ def compute_distance_reduction(greedy: SolverResponse, quantum: SolverResponse)
     
     Returns positive value if quantum is better, negative if greedy is better.
     """
-    if greedy.total_distance == 0:
-        return 0.0
-    
-    return ((greedy.total_distance - quantum.total_distance) / greedy.total_distance) * 100
+    return reduction_pct(greedy.total_distance, quantum.total_distance)
 
 
 def compute_time_reduction(greedy: SolverResponse, quantum: SolverResponse) -> float:
     """
     Compute percentage travel time reduction of quantum vs greedy.
     """
-    if greedy.travel_time == 0:
-        return 0.0
-    
-    return ((greedy.travel_time - quantum.travel_time) / greedy.travel_time) * 100
+    return reduction_pct(greedy.travel_time, quantum.travel_time)
 
 
 def compare_solutions(
@@ -63,8 +79,6 @@ def compute_experiment_stats(results: list[dict]) -> dict:
     Returns:
         Dictionary with mean, std, min, max for each metric
     """
-    import statistics
-    
     if not results:
         return {}
     
@@ -77,13 +91,16 @@ def compute_experiment_stats(results: list[dict]) -> dict:
     
     stats = {}
     for metric in metrics:
-        values = [r.get(metric, 0) for r in results if metric in r]
-        if values:
+        # Rows from a skipped solver carry None for its metrics
+        values = np.fromiter(
+            (r[metric] for r in results if r.get(metric) is not None), dtype=np.float64
+        )
+        if values.size:
             stats[metric] = {
-                "mean": round(statistics.mean(values), 2),
-                "std": round(statistics.stdev(values) if len(values) > 1 else 0, 2),
-                "min": round(min(values), 2),
-                "max": round(max(values), 2)
+                "mean": round(float(values.mean()), 2),
+                "std": round(float(values.std(ddof=1)) if values.size > 1 else 0, 2),
+                "min": round(float(values.min()), 2),
+                "max": round(float(values.max()), 2)
             }
     
     # Compute feasibility and priority satisfaction rates
@@ -6,10 +6,14 @@ routing solutions from quantum and greedy solvers.
 """
 
 from dataclasses import dataclass
+from itertools import zip_longest
 from typing import Optional
-import statistics
+import math
+
+import numpy as np
 
 from src.data_models import SolverResponse, CityGraph
+from src.metrics import reduction_pct
 
 
 @dataclass
@@ -62,6 +66,30 @@ class ExperimentMetrics:
     avg_greedy_solve_ms: float
 
 
+@dataclass
+class _RunningStats:
+    """Single-pass mean, sample std, min and max (Welford's algorithm)."""
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    min: float = math.inf
+    max: float = -math.inf
+
+    def add(self, value: float) -> None:
+        """Fold one value into the running statistics."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation (0 for fewer than two values)."""
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0
+
+
 def compute_route_metrics(
     result: SolverResponse,
     graph: CityGraph
@@ -93,24 +121,20 @@ def compute_route_metrics(
             normal_zone_distance=0
         )
     
-    # Build edge lookup
-    edge_lookup = {}
-    for edge in graph.edges:
-        edge_lookup[(edge.from_node, edge.to_node)] = edge
-        edge_lookup[(edge.to_node, edge.from_node)] = edge
+    # Edge lookup cached on the graph, shared across calls
+    edge_lookup = graph._lookups().legs
     
     # Compute leg distances
     leg_distances = []
     for i in range(len(route) - 1):
         key = (route[i], route[i + 1])
         if key in edge_lookup:
-            leg_distances.append(edge_lookup[key].distance)
+            leg_distances.append(edge_lookup[key][0])
         else:
             leg_distances.append(float('inf'))
     
     # Find priority zone boundary
-    priority_ids = {n.id for n in graph.nodes if n.type.value == "priority"}
-    k = len(priority_ids)
+    k = len(graph._lookups().priority_ids)
     
     priority_zone_dist = sum(leg_distances[:k-1]) if k > 1 else 0
     normal_zone_dist = sum(leg_distances[k:]) if k < len(route) else 0
@@ -125,7 +149,13 @@ def compute_route_metrics(
     else:
         efficiency = 1
     
-    valid_legs = [d for d in leg_distances if d < float('inf')]
+    # Leg statistics as NumPy reductions over the finite legs
+    legs = np.array(leg_distances, dtype=np.float64)
+    valid_legs = legs[np.isfinite(legs)]
+    if valid_legs.size:
+        avg_leg, max_leg, min_leg = float(valid_legs.mean()), float(valid_legs.max()), float(valid_legs.min())
+    else:
+        avg_leg = max_leg = min_leg = 0
     
     return RouteMetrics(
         total_distance=result.total_distance,
@@ -133,9 +163,9 @@ def compute_route_metrics(
         feasible=result.feasible,
         priority_satisfied=result.priority_satisfied,
         solve_time_ms=result.solve_time_ms,
-        avg_leg_distance=statistics.mean(valid_legs) if valid_legs else 0,
-        max_leg_distance=max(valid_legs) if valid_legs else 0,
-        min_leg_distance=min(valid_legs) if valid_legs else 0,
+        avg_leg_distance=avg_leg,
+        max_leg_distance=max_leg,
+        min_leg_distance=min_leg,
         efficiency_ratio=efficiency,
         priority_zone_distance=priority_zone_dist,
         normal_zone_distance=normal_zone_dist
@@ -156,23 +186,9 @@ def compare_solutions(
     Returns:
         ComparisonMetrics with reduction percentages
     """
-    # Distance reduction: positive means quantum is better
-    if greedy_result.total_distance > 0:
-        dist_reduction = (
-            (greedy_result.total_distance - quantum_result.total_distance)
-            / greedy_result.total_distance * 100
-        )
-    else:
-        dist_reduction = 0
-    
-    # Time reduction
-    if greedy_result.travel_time > 0:
-        time_reduction = (
-            (greedy_result.travel_time - quantum_result.travel_time)
-            / greedy_result.travel_time * 100
-        )
-    else:
-        time_reduction = 0
+    # Reductions: positive means quantum is better
+    dist_reduction = reduction_pct(greedy_result.total_distance, quantum_result.total_distance)
+    time_reduction = reduction_pct(greedy_result.travel_time, quantum_result.travel_time)
     
     # Solve time ratio
     if greedy_result.solve_time_ms > 0:
@@ -220,38 +236,41 @@ def aggregate_experiment_results(
             avg_greedy_solve_ms=0
         )
     
-    # Count feasible and priority-satisfied
-    feasible = sum(1 for r in quantum_results if r.feasible)
-    priority_sat = sum(1 for r in quantum_results if r.priority_satisfied)
-    
-    # Compute reductions for feasible solutions
-    distance_reductions = []
-    time_reductions = []
-    
-    for qr, gr in zip(quantum_results, greedy_results):
-        if qr.feasible and gr.total_distance > 0:
-            dr = (gr.total_distance - qr.total_distance) / gr.total_distance * 100
-            distance_reductions.append(dr)
-        if qr.feasible and gr.travel_time > 0:
-            tr = (gr.travel_time - qr.travel_time) / gr.travel_time * 100
-            time_reductions.append(tr)
-    
-    # Solve times
-    quantum_times = [r.solve_time_ms for r in quantum_results]
-    greedy_times = [r.solve_time_ms for r in greedy_results]
-    
+    # One pass over the paired results, with no intermediate lists
+    feasible = priority_sat = 0
+    distance_stats, time_stats = _RunningStats(), _RunningStats()
+    quantum_time_total = greedy_time_total = 0.0
+    n_greedy = 0
+
+    for qr, gr in zip_longest(quantum_results, greedy_results):
+        if qr is not None:
+            feasible += qr.feasible
+            priority_sat += qr.priority_satisfied
+            quantum_time_total += qr.solve_time_ms
+        if gr is not None:
+            n_greedy += 1
+            greedy_time_total += gr.solve_time_ms
+        if qr is None or gr is None or not qr.feasible:
+            continue
+        # Reductions for feasible solutions
+        if gr.total_distance > 0:
+            distance_stats.add((gr.total_distance - qr.total_distance) / gr.total_distance * 100)
+        if gr.travel_time > 0:
+            time_stats.add((gr.travel_time - qr.travel_time) / gr.travel_time * 100)
+
+    has_distance = distance_stats.count > 0
     return ExperimentMetrics(
         n_experiments=n,
         feasibility_rate=feasible / n,
         priority_satisfaction_rate=priority_sat / n,
-        avg_distance_reduction=statistics.mean(distance_reductions) if distance_reductions else 0,
-        std_distance_reduction=statistics.stdev(distance_reductions) if len(distance_reductions) > 1 else 0,
-        min_distance_reduction=min(distance_reductions) if distance_reductions else 0,
-        max_distance_reduction=max(distance_reductions) if distance_reductions else 0,
-        avg_time_reduction=statistics.mean(time_reductions) if time_reductions else 0,
-        std_time_reduction=statistics.stdev(time_reductions) if len(time_reductions) > 1 else 0,
-        avg_quantum_solve_ms=statistics.mean(quantum_times) if quantum_times else 0,
-        avg_greedy_solve_ms=statistics.mean(greedy_times) if greedy_times else 0
+        avg_distance_reduction=distance_stats.mean if has_distance else 0,
+        std_distance_reduction=distance_stats.std,
+        min_distance_reduction=distance_stats.min if has_distance else 0,
+        max_distance_reduction=distance_stats.max if has_distance else 0,
+        avg_time_reduction=time_stats.mean if time_stats.count else 0,
+        std_time_reduction=time_stats.std,
+        avg_quantum_solve_ms=quantum_time_total / n,
+        avg_greedy_solve_ms=greedy_time_total / n_greedy if n_greedy else 0
     )
 
 
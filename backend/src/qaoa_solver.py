@@ -10,13 +10,21 @@ Optimizations over baseline:
 - 2-opt local search post-processing for route improvement
 """
 
+import random
+import threading
 import time
 from typing import Any
 
+import numpy as np
+
 from .data_models import CityGraph, QUBOParams, SolverResponse
 from .qubo_builder import (
     build_qubo,
+    cached_qubo_skeleton,
+    apply_penalties,
     decode_route,
+    decode_sampleset,
+    parse_variable,
     validate_route,
     compute_route_metrics,
     count_priority_violations,
@@ -24,6 +32,7 @@ from .qubo_builder import (
     improve_route_2opt,
     auto_tune_qubo_params,
 )
+from .greedy_solver import greedy_priority_solve
 from .config import get_settings
 
 # Import dimod for BQM handling
@@ -41,6 +50,71 @@ try:
 except ImportError:
     QISKIT_AVAILABLE = False
 
+# Conditional import for dwave-tabu (MockSampler keeps its greedy reads without it)
+try:
+    from tabu import TabuSampler
+    TABU_AVAILABLE = True
+except ImportError:
+    TABU_AVAILABLE = False
+
+# Conditional import for Numba (the NumPy loop is used without it)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _greedy_read_kernel(
+    marginals: np.ndarray,
+    pos_vars: np.ndarray,
+    pos_nodes: np.ndarray,
+    pos_counts: np.ndarray,
+    neighbors: np.ndarray,
+    couplings: np.ndarray,
+    indptr: np.ndarray,
+    used_nodes: np.ndarray,
+    out: np.ndarray,
+) -> None:
+    """
+    Deterministic greedy read, compiled with Numba when available.
+
+    Picks the first minimum on ties, like np.argmin.
+
+    Args:
+        marginals: Marginal energy per variable (updated in place)
+        pos_vars: Variables of each position, padded row per position
+        pos_nodes: Node placed by each entry of pos_vars
+        pos_counts: Number of valid entries in each row
+        neighbors: CSR neighbor indices
+        couplings: CSR interaction biases
+        indptr: CSR row pointers
+        used_nodes: Boolean mask of placed nodes (updated in place)
+        out: Receives the chosen variable per position, -1 if none
+    """
+    for p in range(pos_vars.shape[0]):
+        best = -1
+        best_marginal = 0.0
+        for c in range(pos_counts[p]):
+            if used_nodes[pos_nodes[p, c]]:
+                continue
+            marginal = marginals[pos_vars[p, c]]
+            if best < 0 or marginal < best_marginal:
+                best = c
+                best_marginal = marginal
+        if best < 0:
+            out[p] = -1
+            continue
+        var = pos_vars[p, best]
+        out[p] = var
+        used_nodes[pos_nodes[p, best]] = True
+        for e in range(indptr[var], indptr[var + 1]):
+            marginals[neighbors[e]] += couplings[e]
+
+
+if NUMBA_AVAILABLE:
+    _greedy_read_kernel = njit(cache=True)(_greedy_read_kernel)
+
 
 class MockSampler:
     """Mock sampler for testing without Qiskit/quantum access.
@@ -49,8 +123,21 @@ class MockSampler:
     marginal QUBO energy of assigning each unused node and picks the one
     with the lowest cost. This respects priority constraints (penalty B)
     and distance objectives encoded in the QUBO.
+
+    When dwave-tabu is installed, each greedy read is then used as the
+    starting state of a short tabu search.
     """
 
+    def __init__(self, rng: random.Random | None = None):
+        """
+        Initialize mock sampler.
+
+        Args:
+            rng: Random generator for tie-breaking and tabu seeds
+                 (defaults to the global random module)
+        """
+        self.rng = rng if rng is not None else random
+
     def sample(self, bqm: BinaryQuadraticModel, num_reads: int = 1, **kwargs) -> SampleSet:
         """Return mock sample(s) using energy-aware greedy assignment.
 
@@ -58,76 +145,122 @@ class MockSampler:
             bqm: Binary quadratic model to sample from
             num_reads: Number of independent samples to generate.
                        Additional reads use randomized tie-breaking for diversity.
+            **kwargs: timeout_ms sets the per-read tabu time limit (default 20)
 
         Returns:
             SampleSet with the best sample(s)
         """
-        import random
-
-        all_samples = []
-        all_energies = []
-
         variables = list(bqm.variables)
+        n_vars = len(variables)
 
-        # Parse variables to understand structure
+        # Parse variables to understand structure: per position, the flat
+        # indices of its variables and the (integer) node each one places
         positions = {}
-        for var in variables:
-            parts = var.split("_")
-            node_id = "_".join(parts[1:-1])
-            pos = int(parts[-1])
-            if pos not in positions:
-                positions[pos] = []
-            positions[pos].append((var, node_id))
+        node_index = {}
+        for i, var in enumerate(variables):
+            node_id, pos = parse_variable(var)
+            positions.setdefault(pos, ([], []))
+            positions[pos][0].append(i)
+            positions[pos][1].append(node_index.setdefault(node_id, len(node_index)))
+        positions = {
+            pos: (np.array(vars_, dtype=np.intp), np.array(nodes, dtype=np.intp))
+            for pos, (vars_, nodes) in positions.items()
+        }
+
+        # Biases as flat arrays, with the interactions in CSR form so each
+        # variable's neighbors are one contiguous slice
+        linear, (irow, icol, qdata), _ = bqm.to_numpy_vectors(variable_order=variables)
+        rows = np.concatenate([irow, icol])
+        order = np.argsort(rows, kind="stable")
+        neighbors = np.concatenate([icol, irow])[order]
+        couplings = np.concatenate([qdata, qdata])[order]
+        indptr = np.zeros(n_vars + 1, dtype=np.intp)
+        np.cumsum(np.bincount(rows, minlength=n_vars), out=indptr[1:])
+
+        samples = np.zeros((num_reads, n_vars), dtype=np.int8)
 
         for read_idx in range(num_reads):
-            sample = {var: 0 for var in variables}
-            used_nodes = set()
-            assigned_vars = set()
+            used_nodes = np.zeros(len(node_index), dtype=bool)
+            # Marginal energy of each variable given those assigned so far:
+            # the linear bias, plus each assigned neighbor's interaction,
+            # folded in once when that neighbor is assigned
+            marginals = linear.astype(np.float64, copy=True)
+
+            if read_idx == 0 and NUMBA_AVAILABLE:
+                # The deterministic read runs entirely in the compiled kernel
+                chosen = np.empty(len(positions), dtype=np.intp)
+                _greedy_read_kernel(marginals, *self._padded(positions), neighbors, couplings,
+                                    indptr, used_nodes, chosen)
+                samples[read_idx, chosen[chosen >= 0]] = 1
+                continue
 
             for pos in sorted(positions.keys()):
-                candidates = []
-                for var, node_id in positions[pos]:
-                    if node_id in used_nodes:
-                        continue
-
-                    # Marginal energy = linear bias + interactions with assigned vars
-                    marginal = bqm.linear.get(var, 0.0)
-                    adj_var = bqm.adj[var]
-                    for assigned_var in assigned_vars:
-                        if assigned_var in adj_var:
-                            marginal += adj_var[assigned_var]
+                pos_vars, pos_nodes = positions[pos]
+                free = ~used_nodes[pos_nodes]
+                cand_vars, cand_nodes = pos_vars[free], pos_nodes[free]
 
-                    candidates.append((marginal, var, node_id))
-
-                if not candidates:
+                if not cand_vars.size:
                     continue
 
-                candidates.sort(key=lambda x: x[0])
+                cand_marginals = marginals[cand_vars]
 
                 if read_idx == 0:
-                    # First read: deterministic greedy (best marginal)
-                    _, best_var, best_node = candidates[0]
+                    # First read: deterministic greedy (best marginal, first on ties)
+                    best = int(np.argmin(cand_marginals))
                 else:
                     # Subsequent reads: randomized tie-breaking among top candidates
                     # Pick from candidates within 10% of best marginal energy
-                    best_energy = candidates[0][0]
+                    ranked = np.argsort(cand_marginals, kind="stable")
+                    best_energy = cand_marginals[ranked[0]]
                     threshold = best_energy + abs(best_energy) * 0.1 + 1e-6
-                    top = [c for c in candidates if c[0] <= threshold]
-                    _, best_var, best_node = random.choice(top)
-
-                sample[best_var] = 1
-                used_nodes.add(best_node)
-                assigned_vars.add(best_var)
-
-            energy = bqm.energy(sample)
-            all_samples.append(sample)
-            all_energies.append(energy)
-
-        return SampleSet.from_samples(all_samples, vartype=bqm.vartype, energy=all_energies)
+                    top = ranked[cand_marginals[ranked] <= threshold]
+                    best = self.rng.choice(top.tolist())
+
+                best_var = cand_vars[best]
+                samples[read_idx, best_var] = 1
+                used_nodes[cand_nodes[best]] = True
+                start, end = indptr[best_var], indptr[best_var + 1]
+                marginals[neighbors[start:end]] += couplings[start:end]
+
+        if TABU_AVAILABLE:
+            # Refine each greedy read with compiled tabu search. Tabu returns
+            # the best state it visits, so no read ends above its greedy start;
+            # the seed is drawn from self.rng so seeded runs stay reproducible
+            return TabuSampler().sample(
+                bqm,
+                initial_states=(samples, variables),
+                timeout=int(kwargs.get("timeout_ms", 20)),
+                seed=self.rng.randrange(2 ** 32),
+            )
+
+        energies = bqm.energies((samples, variables))
+        return SampleSet.from_samples((samples, variables), vartype=bqm.vartype, energy=energies)
+
+    @staticmethod
+    def _padded(
+        positions: dict[int, tuple[np.ndarray, np.ndarray]]
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Per-position variable and node arrays as padded 2D arrays, in position order."""
+        rows = [positions[pos] for pos in sorted(positions.keys())]
+        counts = np.array([len(vars_) for vars_, _ in rows], dtype=np.intp)
+        width = int(counts.max()) if len(counts) else 0
+        pos_vars = np.full((len(rows), width), -1, dtype=np.intp)
+        pos_nodes = np.full((len(rows), width), -1, dtype=np.intp)
+        for r, (vars_, nodes) in enumerate(rows):
+            pos_vars[r, :len(vars_)] = vars_
+            pos_nodes[r, :len(nodes)] = nodes
+        return pos_vars, pos_nodes, counts
 
 
 class QAOASampler:
-    """QAOA-based sampler using Qiskit."""
+    """QAOA-based sampler using Qiskit.
+
+    The primitive sampler, optimizer, QAOA instance and MinimumEigenOptimizer
+    are built once per sampler and reused for every problem; only the
+    QuadraticProgram is built per call. COBYLA is warm-started from the
+    angles that last converged for a problem of the same size. Instances are not thread-safe, see
+    _select_sampler for per-thread reuse.
+    """
 
     def __init__(self, reps: int = 2, shots: int = 1024):
         """
@@ -140,6 +273,14 @@ class QAOASampler:
         self.reps = reps
         self.shots = shots
 
+        # Create QAOA instance with StatevectorSampler (Qiskit 2.x compatible)
+        self._qaoa = QAOA(sampler=StatevectorSampler(), optimizer=COBYLA(maxiter=200), reps=reps)
+        self._algorithm = MinimumEigenOptimizer(self._qaoa)
+
+        # Last converged (beta, gamma) angles per problem size, used as the
+        # next COBYLA starting point for a problem of the same size
+        self._angles: dict[int, np.ndarray] = {}
+
     def sample(self, bqm, **kwargs):
         """
         Solve QUBO using QAOA.
@@ -152,35 +293,30 @@ class QAOASampler:
         """
         # Convert BQM to Qiskit QuadraticProgram
         qp = QuadraticProgram()
+        variables = list(bqm.variables)
 
         # Add binary variables
-        for var in bqm.variables:
+        for var in variables:
             qp.binary_var(var)
 
-        # Build linear and quadratic terms
-        linear = {}
-        quadratic = {}
-
-        for var, bias in bqm.linear.items():
-            linear[var] = bias
-
-        for (u, v), bias in bqm.quadratic.items():
-            quadratic[(u, v)] = bias
-
-        # Set objective (minimize)
-        qp.minimize(constant=bqm.offset, linear=linear, quadratic=quadratic)
-
-        # Create QAOA instance with StatevectorSampler (Qiskit 2.x compatible)
-        sampler = StatevectorSampler()
-        optimizer = COBYLA(maxiter=200)
-        qaoa = QAOA(sampler=sampler, optimizer=optimizer, reps=self.reps)
-
-        # Solve using MinimumEigenOptimizer
-        algorithm = MinimumEigenOptimizer(qaoa)
-        result = algorithm.solve(qp)
-
-        # Convert result to dimod SampleSet format
-        sample = {var: int(result.variables_dict.get(var, 0)) for var in bqm.variables}
+        # Set objective (minimize) from dense arrays in variable order:
+        # QuadraticProgram takes them directly, without per-term dict traffic
+        linear, (rows, cols, biases), offset = bqm.to_numpy_vectors(variable_order=variables)
+        quadratic = np.zeros((len(variables), len(variables)))
+        quadratic[rows, cols] = biases
+        qp.minimize(constant=float(offset), linear=linear, quadratic=quadratic)
+
+        # Solve using the reusable MinimumEigenOptimizer, warm-started from
+        # the angles that converged last time for this many variables
+        self._qaoa.initial_point = self._angles.get(len(variables))
+        result = self._algorithm.solve(qp)
+        eigen_result = result.min_eigen_solver_result
+        if eigen_result is not None and eigen_result.optimal_point is not None:
+            self._angles[len(variables)] = np.asarray(eigen_result.optimal_point)
+
+        # Convert result to dimod SampleSet format (result.x follows the
+        # QuadraticProgram's variable order)
+        sample = dict(zip(variables, np.rint(result.x).astype(int).tolist()))
         energy = bqm.energy(sample)
 
         return SampleSet.from_samples([sample], vartype=bqm.vartype, energy=[energy])
@@ -189,7 +325,8 @@ class QAOASampler:
 def quantum_solve(
     graph: CityGraph,
     params: QUBOParams | None = None,
-    use_mock: bool = False
+    use_mock: bool = False,
+    rng: random.Random | None = None
 ) -> SolverResponse:
     """
     Solve routing problem using QAOA quantum optimization.
@@ -203,12 +340,18 @@ def quantum_solve(
         graph: City graph to solve
         params: QUBO penalty parameters (auto-tuned if None)
         use_mock: Use mock sampler instead of real QAOA
+        rng: Random generator for the mock sampler (defaults to the global
+             random module)
 
     Returns:
         SolverResponse with route and metrics
     """
     start_time = time.time()
 
+    # Without priority nodes the problem is a plain TSP: skip the QUBO
+    if not graph.priority_nodes:
+        return _classical_shortcut(graph, start_time)
+
     # Auto-tune if no explicit params
     if params is None:
         params = auto_tune_qubo_params(graph)
@@ -216,18 +359,87 @@ def quantum_solve(
     # Build QUBO
     bqm = build_qubo(graph, params)
 
-    # Select sampler
+    sampler, solver_name, num_reads = _select_sampler(use_mock, rng)
+    return _solve_bqm(graph, bqm, sampler, solver_name, num_reads, start_time)
+
+
+def quantum_solve_batch(
+    graph: CityGraph,
+    params_list: list[QUBOParams | None],
+    use_mock: bool = False,
+    rng: random.Random | None = None
+) -> list[SolverResponse]:
+    """
+    Solve one graph for several QUBO parameter sets.
+
+    The graph-dependent QUBO skeleton and the sampler are built once and
+    shared; only the penalty coefficients are re-applied per parameter set.
+    Each result's solve_time_ms includes an equal share of that setup, so
+    the times add up to the batch's wall time and stay comparable with
+    quantum_solve.
+
+    Args:
+        graph: City graph to solve
+        params_list: QUBO penalty parameters (None entries are auto-tuned)
+        use_mock: Use mock sampler instead of real QAOA
+        rng: Random generator for the mock sampler (defaults to the global
+             random module)
+
+    Returns:
+        One SolverResponse per entry of params_list, in the same order
+    """
+    if not graph.priority_nodes:
+        # Plain TSP: the penalties do not matter, see quantum_solve
+        return [_classical_shortcut(graph, time.time()) for _ in params_list]
+
+    setup_start = time.time()
+    skeleton = cached_qubo_skeleton(graph)
+    sampler, solver_name, num_reads = _select_sampler(use_mock, rng)
+    # Amortized share of the shared setup, charged to every result
+    setup_share = (time.time() - setup_start) / max(len(params_list), 1)
+
+    results = []
+    for params in params_list:
+        start_time = time.time() - setup_share
+        if params is None:
+            params = auto_tune_qubo_params(graph)
+        bqm = apply_penalties(skeleton, params)
+        results.append(_solve_bqm(graph, bqm, sampler, solver_name, num_reads, start_time))
+
+    return results
+
+
+_thread_samplers = threading.local()
+
+
+def _select_sampler(use_mock: bool, rng: random.Random | None = None) -> tuple[Any, str, int]:
+    """Pick the sampler for a solve, returning (sampler, solver_name, num_reads)."""
     settings = get_settings()
 
     if use_mock or not QISKIT_AVAILABLE or settings.qaoa_use_mock:
-        sampler = MockSampler()
-        solver_name = "QAOA"
-        num_reads = 5  # Generate multiple diverse samples
-    else:
-        sampler = QAOASampler(reps=settings.qaoa_reps, shots=settings.qaoa_shots)
-        solver_name = f"QAOA (reps={settings.qaoa_reps})"
-        num_reads = 1
+        return MockSampler(rng), "QAOA", 5  # Generate multiple diverse samples
+
+    # Reuse one QAOASampler per thread and configuration: building the
+    # Qiskit objects is not free, and sharing them across threads is unsafe
+    samplers = getattr(_thread_samplers, "by_config", None)
+    if samplers is None:
+        samplers = _thread_samplers.by_config = {}
+    config = (settings.qaoa_reps, settings.qaoa_shots)
+    sampler = samplers.get(config)
+    if sampler is None:
+        sampler = samplers[config] = QAOASampler(reps=settings.qaoa_reps, shots=settings.qaoa_shots)
+    return sampler, f"QAOA (reps={settings.qaoa_reps})", 1
 
+
+def _solve_bqm(
+    graph: CityGraph,
+    bqm: BinaryQuadraticModel,
+    sampler: Any,
+    solver_name: str,
+    num_reads: int,
+    start_time: float
+) -> SolverResponse:
+    """Sample a routing BQM, decode the best route and compute its metrics."""
     # Sample (with multiple reads for mock)
     sampleset = sampler.sample(bqm, num_reads=num_reads, label="priority-routing")
 
@@ -241,8 +453,7 @@ def quantum_solve(
     best_feasible = False
     best_priority = False
 
-    for datum in sampleset.data(fields=["sample", "energy"]):
-        route = decode_route(datum.sample, node_ids, depot_id=depot.id if depot else None)
+    for route, energy in decode_sampleset(sampleset, node_ids, depot_id=depot.id if depot else None):
         feasible, priority_satisfied = validate_route(route, graph)
 
         if feasible:
@@ -260,13 +471,13 @@ def quantum_solve(
             if is_better:
                 best_route = route
                 best_travel_time = travel_time
-                best_energy = datum.energy
+                best_energy = energy
                 best_feasible = True
                 best_priority = priority_satisfied
         elif best_route is None:
             # Keep infeasible as fallback
             best_route = route
-            best_energy = datum.energy
+            best_energy = energy
 
     # Fallback: use first sample if nothing worked
     if best_route is None:
@@ -278,6 +489,32 @@ def quantum_solve(
     if best_feasible:
         best_route = improve_route_2opt(best_route, graph)
 
+    return _route_response(graph, best_route, best_energy, solver_name, start_time)
+
+
+def _classical_shortcut(graph: CityGraph, start_time: float) -> SolverResponse:
+    """
+    Solve a graph without priority nodes classically.
+
+    With no priority ordering to encode, the QUBO reduces to a plain TSP
+    that the mock greedy and QAOA both solve worse and slower than
+    nearest-neighbor + 2-opt, so the route comes from the priority-aware
+    greedy (which, with no priorities, is exactly that).
+    """
+    route = greedy_priority_solve(graph).route
+    return _route_response(graph, route, None, "classical-shortcut", start_time)
+
+
+def _route_response(
+    graph: CityGraph,
+    best_route: list[str],
+    best_energy: float | None,
+    solver_name: str,
+    start_time: float
+) -> SolverResponse:
+    """Validate a quantum-path route and build its SolverResponse."""
+    depot = graph.depot_node
+
     # Final validation and metrics
     feasible, priority_satisfied = validate_route(best_route, graph)
 
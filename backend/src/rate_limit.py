@@ -1,11 +1,17 @@
 """
-Rate limiting configuration using slowapi.
+In-process token-bucket rate limiting.
+
+The API runs as a single asyncio process, so per-key buckets kept in a
+plain dict are sufficient: each check is a dict lookup plus a few float
+operations, with no locking and no external storage.
 """
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+import math
+import time
+
+from fastapi import Depends, HTTPException
 from starlette.requests import Request
 
-from src.config import get_settings
+from src.auth import verify_api_key
 
 
 def get_api_key_from_request(request: Request) -> str:
@@ -16,16 +22,81 @@ def get_api_key_from_request(request: Request) -> str:
     api_key = request.headers.get("X-API-Key")
     if api_key:
         return api_key
-    return get_remote_address(request)
+    return request.client.host if request.client else "unknown"
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously from a monotonic clock.
+
+    Args:
+        capacity: Maximum number of tokens (burst size)
+        rate: Tokens added per second
+        now: Current monotonic time; the bucket starts full
+    """
+    __slots__ = ("tokens", "last", "rate", "capacity")
+
+    def __init__(self, capacity: float, rate: float, now: float):
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = capacity
+        self.last = now
+
+    def take(self, now: float, cost: float = 1.0) -> bool:
+        """
+        Refill for the time elapsed since the last call, then try to spend tokens.
+
+        Returns:
+            True if the tokens were taken, False if the bucket is short
+        """
+        self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+        if self.tokens >= cost:
+            self.tokens -= cost
+            return True
+        return False
+
+    def seconds_until(self, cost: float = 1.0) -> float:
+        """Seconds until `cost` tokens will be available (as of the last take)."""
+        return max(0.0, (cost - self.tokens) / self.rate)
+
+
+class RateLimiter:
+    """
+    FastAPI dependency enforcing a per-minute limit per API key.
+
+    Each instance keeps its own buckets, so every route given its own
+    instance is limited independently. Depends on verify_api_key, so
+    unauthenticated requests are rejected before they touch a bucket.
+
+    Args:
+        per_minute: Requests allowed per minute (also the burst size)
+    """
+
+    def __init__(self, per_minute: int):
+        self.per_minute = per_minute
+        # Everything derived from the limit is computed once, here
+        self._rate = per_minute / 60.0
+        self._detail = f"Rate limit exceeded: {per_minute} per 1 minute"
+        self._buckets: dict[str, TokenBucket] = {}
 
+    async def __call__(self, request: Request, _: bool = Depends(verify_api_key)) -> None:
+        """
+        Take one token for the caller.
 
-settings = get_settings()
+        Raises:
+            HTTPException: 429 with a Retry-After header when the limit is hit
+        """
+        now = time.monotonic()
+        key = get_api_key_from_request(request)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = TokenBucket(self.per_minute, self._rate, now)
 
-# Create limiter with API key as the rate limit key
-# Note: headers_enabled must be False when using FastAPI response models (not Response objects)
-# We add Retry-After header manually in the exception handler
-limiter = Limiter(
-    key_func=get_api_key_from_request,
-    default_limits=[f"{settings.rate_limit_per_minute}/minute"],
-    headers_enabled=False
-)
+        if not bucket.take(now):
+            # RFC 6585 recommends including Retry-After header with 429 responses
+            raise HTTPException(
+                status_code=429,
+                detail=self._detail,
+                headers={"Retry-After": str(math.ceil(bucket.seconds_until()))}
+            )
@@ -13,6 +13,8 @@ from pathlib import Path
 # Allowlist pattern for graph names: alphanumeric, hyphens, underscores only.
 # This prevents path traversal (../, ..\\) and other injection attacks by
 # rejecting any characters that could be interpreted as path components.
+# Compiled once at import; use fullmatch() so a trailing newline (which "$"
+# alone tolerates) is rejected too.
 GRAPH_NAME_PATTERN = re.compile(r'^[a-zA-Z0-9_-]+$')
 
 # Base directory for graph data files.
@@ -44,7 +46,7 @@ def validate_graph_path(graph_name: str) -> Path:
         - Ensures final path is within the designated data directory
     """
     # Check 1: Allowlist validation - reject any non-alphanumeric characters
-    if not GRAPH_NAME_PATTERN.match(graph_name):
+    if not GRAPH_NAME_PATTERN.fullmatch(graph_name):
         raise ValueError(
             "Invalid graph name: must be alphanumeric, hyphens, underscores only"
         )
@@ -10,11 +10,33 @@ Generates random city graphs for experiments with configurable:
 
 import random
 import math
+import zlib
 from typing import Literal
 
+import numpy as np
+
 from .data_models import Node, Edge, CityGraph, NodeType, TrafficLevel
 
 
+def experiment_seed(n_nodes: int, traffic_profile: str, run: int) -> int:
+    """
+    Derive a reproducible seed for one experiment configuration.
+
+    Uses CRC-32 rather than the built-in hash(), which is randomized per
+    interpreter for strings (PYTHONHASHSEED), so seeds agree across runs
+    and across worker processes.
+
+    Args:
+        n_nodes: Number of nodes
+        traffic_profile: Traffic profile name
+        run: Run index within the configuration
+
+    Returns:
+        Seed in [0, 2**31)
+    """
+    return zlib.crc32(f"{n_nodes}|{traffic_profile}|{run}".encode()) % (2**31)
+
+
 def generate_random_city(
     n_nodes: int = 10,
     priority_ratio: float = 0.3,
@@ -22,6 +44,7 @@ def generate_random_city(
     connectivity: int = 3,
     seed: int | None = None,
     include_depot: bool = False,
+    rng: random.Random | None = None,
 ) -> CityGraph:
     """
     Generate a random city graph for testing.
@@ -31,14 +54,21 @@ def generate_random_city(
         priority_ratio: Fraction of delivery nodes that are priority (0.0-1.0)
         traffic_profile: Distribution of traffic levels
         connectivity: Average number of edges per node (k-nearest neighbors)
-        seed: Random seed for reproducibility
+        seed: Random seed for reproducibility (None draws from the global
+            random module)
         include_depot: If True, the first node is a depot/warehouse near grid center
+        rng: Random generator to draw from (takes precedence over seed); callers
+            generating many graphs can reuse one instead of seeding per graph
 
     Returns:
         CityGraph with random nodes and edges
     """
-    if seed is not None:
-        random.seed(seed)
+    # A private generator: seeding it yields the same graphs as seeding the
+    # global random module did, without clobbering the process-wide state.
+    # Without a seed, draw from the global module as before, so callers that
+    # seed it themselves still get reproducible graphs.
+    if rng is None:
+        rng = random.Random(seed) if seed is not None else random
 
     # Generate node positions in a 10x10 grid
     nodes = []
@@ -47,8 +77,8 @@ def generate_random_city(
     # If depot requested, create it first near grid center
     start_idx = 0
     if include_depot:
-        dx = random.uniform(4, 6)
-        dy = random.uniform(4, 6)
+        dx = rng.uniform(4, 6)
+        dy = rng.uniform(4, 6)
         positions.append((dx, dy))
         nodes.append(Node(
             id="D0",
@@ -61,12 +91,12 @@ def generate_random_city(
 
     n_delivery = n_nodes - start_idx
     for i in range(n_delivery):
-        x = random.uniform(0, 10)
-        y = random.uniform(0, 10)
+        x = rng.uniform(0, 10)
+        y = rng.uniform(0, 10)
         positions.append((x, y))
 
         # Assign priority based on ratio
-        is_priority = random.random() < priority_ratio
+        is_priority = rng.random() < priority_ratio
         node_type = NodeType.PRIORITY if is_priority else NodeType.NORMAL
 
         nodes.append(Node(
@@ -93,24 +123,22 @@ def generate_random_city(
     edges = []
     seen_edges = set()
     
-    for i, (x1, y1) in enumerate(positions):
-        # Compute distances to all other nodes
-        distances = []
-        for j, (x2, y2) in enumerate(positions):
-            if i != j:
-                dist = math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
-                distances.append((j, dist))
-        
-        # Connect to k-nearest neighbors
-        distances.sort(key=lambda x: x[1])
-        
+    # All pairwise distances in one vectorized pass
+    coords = np.array(positions, dtype=np.float64)
+    pairwise = np.sqrt(((coords[:, None, :] - coords[None, :, :]) ** 2).sum(-1))
+
+    for i in range(len(positions)):
+        # Connect to k-nearest neighbors (stable sort keeps index order on ties)
+        ranked = np.argsort(pairwise[i], kind="stable").tolist()
+        distances = [(j, float(pairwise[i, j])) for j in ranked if j != i]
+
         for j, dist in distances[:connectivity]:
             edge_key = tuple(sorted([i, j]))
             if edge_key not in seen_edges:
                 seen_edges.add(edge_key)
                 
                 # Assign traffic based on profile
-                traffic = _get_traffic_level(traffic_profile)
+                traffic = _get_traffic_level(traffic_profile, rng)
                 
                 edges.append(Edge(
                     from_node=nodes[i].id,
@@ -120,7 +148,7 @@ def generate_random_city(
                 ))
     
     # Ensure graph is connected (add edges if necessary)
-    edges = _ensure_connectivity(nodes, edges, positions, traffic_profile)
+    edges = _ensure_connectivity(nodes, edges, positions, traffic_profile, rng)
     
     return CityGraph(
         nodes=nodes,
@@ -133,7 +161,7 @@ def generate_random_city(
     )
 
 
-def _get_traffic_level(profile: str) -> TrafficLevel:
+def _get_traffic_level(profile: str, rng: random.Random) -> TrafficLevel:
     """Get a random traffic level based on profile."""
     if profile == "low":
         weights = [0.7, 0.2, 0.1]
@@ -143,14 +171,15 @@ def _get_traffic_level(profile: str) -> TrafficLevel:
         weights = [0.33, 0.34, 0.33]
     
     levels = [TrafficLevel.LOW, TrafficLevel.MEDIUM, TrafficLevel.HIGH]
-    return random.choices(levels, weights=weights)[0]
+    return rng.choices(levels, weights=weights)[0]
 
 
 def _ensure_connectivity(
     nodes: list[Node],
     edges: list[Edge],
     positions: list[tuple[float, float]],
-    traffic_profile: str
+    traffic_profile: str,
+    rng: random.Random
 ) -> list[Edge]:
     """Ensure the graph is connected using union-find."""
     n = len(nodes)
@@ -193,7 +222,7 @@ def _ensure_connectivity(
                         from_node=nodes[i].id,
                         to_node=nodes[j].id,
                         distance=round(dist, 2),
-                        traffic=_get_traffic_level(traffic_profile)
+                        traffic=_get_traffic_level(traffic_profile, rng)
                     ))
                     seen.add((nodes[i].id, nodes[j].id))
                     union(i, j)
@@ -217,7 +246,7 @@ def generate_experiment_suite(
     for n in n_values:
         for traffic in traffic_profiles:
             for run in range(runs_per_config):
-                seed = hash((n, traffic, run)) % (2**31)
+                seed = experiment_seed(n, traffic, run)
                 graph = generate_random_city(
                     n_nodes=n,
                     traffic_profile=traffic,
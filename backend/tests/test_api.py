@@ -2,6 +2,9 @@
 API Integration Tests.
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+
 import pytest
 from fastapi.testclient import TestClient
 from app.main import app
@@ -31,6 +34,12 @@ class TestHealthEndpoint:
         assert "timestamp" in data
         assert "dependencies" in data
 
+    def test_health_reuses_body_within_ttl(self):
+        """Back-to-back probes should be served from the cached body."""
+        first = client.get("/health").json()
+        second = client.get("/health").json()
+        assert first["timestamp"] == second["timestamp"]
+
 
 class TestSolveEndpoint:
     """Tests for solve endpoint."""
@@ -94,6 +103,42 @@ class TestSolveEndpoint:
         assert response.status_code == 400
 
 
+class TestSolverPool:
+    """Tests for the solver process pool started by the lifespan."""
+
+    def test_solve_runs_in_solver_pool(self):
+        """With the lifespan running, /solve should go through app.state.solver_pool."""
+        request = {
+            "graph": {
+                "nodes": [
+                    {"id": "N1", "x": 0, "y": 0, "type": "priority"},
+                    {"id": "N2", "x": 1, "y": 1, "type": "normal"},
+                ],
+                "edges": [{"from": "N1", "to": "N2", "distance": 1.41, "traffic": "low"}],
+            },
+            "solver": "greedy",
+        }
+        with TestClient(app) as lifespan_client:
+            pool = app.state.solver_pool
+            assert isinstance(pool, ProcessPoolExecutor)
+
+            submitted = []
+            original_submit = pool.submit
+
+            def recording_submit(fn, *args, **kwargs):
+                submitted.append(fn)
+                return original_submit(fn, *args, **kwargs)
+
+            pool.submit = recording_submit
+            response = lifespan_client.post("/solve", json=request, headers=API_HEADERS)
+
+        assert response.status_code == 200
+        assert set(response.json()["route"]) == {"N1", "N2"}
+        assert submitted
+        # The pool is released on shutdown
+        assert app.state.solver_pool is None
+
+
 class TestCompareEndpoint:
     """Tests for compare endpoint."""
 
@@ -164,5 +209,98 @@ class TestGenerateCityEndpoint:
         assert len(data["edges"]) > 0
 
 
+class TestGraphsEndpoint:
+    """Tests for graph listing and retrieval endpoints."""
+
+    @pytest.fixture
+    def data_dir(self, tmp_path, monkeypatch):
+        import app.main as main_module
+        import src.security as security_module
+        monkeypatch.setattr(main_module, "DATA_DIR", tmp_path)
+        monkeypatch.setattr(security_module, "DATA_DIR", tmp_path)
+        monkeypatch.setattr(main_module, "_graphs_cache", None)
+        return tmp_path
+
+    def test_list_graphs_missing_dir(self, data_dir):
+        """Missing data directory should yield an empty listing."""
+        data_dir.rmdir()
+        response = client.get("/graphs", headers=API_HEADERS)
+        assert response.status_code == 200
+        assert response.json() == {"graphs": []}
+
+    def test_list_graphs_refreshes_on_change(self, data_dir):
+        """Listing should pick up new files once the directory changes."""
+        (data_dir / "city_a.json").write_text("{}")
+        first = client.get("/graphs", headers=API_HEADERS).json()
+        assert [g["name"] for g in first["graphs"]] == ["city_a"]
+
+        (data_dir / "city_b.json").write_text("{}")
+        os.utime(data_dir, ns=(0, data_dir.stat().st_mtime_ns + 1))
+        second = client.get("/graphs", headers=API_HEADERS).json()
+        assert sorted(g["name"] for g in second["graphs"]) == ["city_a", "city_b"]
+
+    def test_get_graph_serves_current_contents(self, data_dir):
+        """Graph contents should be served, and re-read after an edit."""
+        graph_file = data_dir / "city_a.json"
+        graph_file.write_text('{"nodes": []}')
+        response = client.get("/graphs/city_a", headers=API_HEADERS)
+        assert response.status_code == 200
+        assert response.json() == {"nodes": []}
+
+        graph_file.write_text('{"nodes": [1]}')
+        os.utime(graph_file, ns=(0, graph_file.stat().st_mtime_ns + 1))
+        assert client.get("/graphs/city_a", headers=API_HEADERS).json() == {"nodes": [1]}
+
+        graph_file.unlink()
+        assert client.get("/graphs/city_a", headers=API_HEADERS).status_code == 404
+
+    def test_graph_bytes_cache_is_bounded_lru(self, data_dir, monkeypatch):
+        """The graph bytes cache should evict the least recently used entry."""
+        from collections import OrderedDict
+        import app.main as main_module
+        monkeypatch.setattr(main_module, "_graph_bytes_cache", OrderedDict())
+        monkeypatch.setattr(main_module, "_GRAPH_BYTES_CACHE_SIZE", 2)
+        for name in ("city_a", "city_b", "city_c"):
+            (data_dir / f"{name}.json").write_text("{}")
+
+        for name in ("city_a", "city_b", "city_a", "city_c"):
+            assert client.get(f"/graphs/{name}", headers=API_HEADERS).status_code == 200
+
+        cached = [path.stem for path in main_module._graph_bytes_cache]
+        assert cached == ["city_a", "city_c"]
+
+
+class TestRequestMiddleware:
+    """Tests for the request context and logging middleware."""
+
+    def test_response_has_request_id(self):
+        """Every response should carry a generated X-Request-ID."""
+        response = client.get("/health")
+        assert response.headers.get("X-Request-ID")
+
+    def test_incoming_request_id_is_echoed(self):
+        """An incoming X-Request-ID should be reused for tracing."""
+        response = client.get("/health", headers={"X-Request-ID": "trace-123"})
+        assert response.headers["X-Request-ID"] == "trace-123"
+
+    def test_error_response_carries_request_id(self):
+        """Error bodies should report the same request ID as the header."""
+        response = client.post("/solve", json={}, headers={"X-Request-ID": "trace-456"})
+        assert response.status_code == 400
+        assert response.json()["request_id"] == "trace-456"
+
+    def test_debug_body_logging_preserves_body(self, monkeypatch):
+        """Reading the body for DEBUG logs must not starve the handler."""
+        import app.middleware as middleware_module
+        monkeypatch.setattr(middleware_module, "is_debug_enabled", lambda: True)
+        response = client.post(
+            "/generate-city",
+            json={"n_nodes": 4, "seed": 1},
+            headers=API_HEADERS,
+        )
+        assert response.status_code == 200
+        assert len(response.json()["nodes"]) == 4
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -75,6 +75,28 @@ class TestGreedySolver:
         result = greedy_solve(simple_graph)
         assert result.solver_used == "greedy"
 
+    def test_greedy_sums_traffic_weighted_legs(self, simple_graph):
+        """Distance and time should be the sums of the legs taken."""
+        result = greedy_solve(simple_graph)
+        assert result.route[:2] == ["N1", "N2"]
+        assert result.total_distance == pytest.approx(6.24)
+        assert result.travel_time == pytest.approx(7.24)
+
+    def test_greedy_falls_back_to_euclidean(self):
+        """Node pairs without an edge should cost their straight-line distance."""
+        graph = CityGraph(
+            nodes=[
+                Node(id="A", x=0, y=0, type=NodeType.NORMAL),
+                Node(id="B", x=3, y=4, type=NodeType.NORMAL),
+                Node(id="C", x=10, y=0, type=NodeType.NORMAL),
+            ],
+            edges=[Edge(from_node="B", to_node="C", distance=7.0, traffic=TrafficLevel.HIGH)],
+        )
+        result = greedy_solve(graph)
+        assert result.route == ["A", "B", "C"]
+        assert result.total_distance == pytest.approx(12.0)
+        assert result.travel_time == pytest.approx(19.0)
+
 
 class TestGreedyWithAllPriority:
     """Tests with all priority nodes."""
@@ -118,6 +140,22 @@ class TestGreedyWithAllNormal:
         assert result.feasible is True
         assert result.priority_satisfied is True  # No priorities to satisfy
 
+    def test_priority_solver_all_normal_visits_start_once(self):
+        """Without depot or priorities, the start node should not be revisited."""
+        nodes = [
+            Node(id="N1", x=0, y=0, type=NodeType.NORMAL),
+            Node(id="N2", x=1, y=0, type=NodeType.NORMAL),
+            Node(id="N3", x=3, y=0, type=NodeType.NORMAL),
+        ]
+        edges = [
+            Edge(from_node="N1", to_node="N2", distance=1.0, traffic=TrafficLevel.LOW),
+        ]
+        graph = CityGraph(nodes=nodes, edges=edges)
+
+        result = greedy_priority_solve(graph)
+        assert result.route == ["N1", "N2", "N3"]
+        assert result.feasible is True
+
 
 class TestGreedyWithDepot:
     """Tests for greedy solver with depot node."""
@@ -237,5 +275,35 @@ class TestGreedyPriorityWithDepot:
         assert result.depot_id == "D0"
 
 
+class TestNearestWalkKernel:
+    """The scalar (Numba) walk must match the NumPy walk."""
+
+    def test_kernel_matches_numpy_walk(self):
+        """Both walks should visit nodes in the same order."""
+        import numpy as np
+        from src.greedy_solver import _nearest_walk_kernel
+
+        rng = np.random.default_rng(0)
+        weighted = rng.integers(1, 5, size=(12, 12)).astype(float)  # many ties
+
+        expected = [0]
+        mask = np.ones(12, dtype=bool)
+        mask[0] = False
+        current = 0
+        while mask.any():
+            remaining = np.flatnonzero(mask)
+            current = int(remaining[np.argmin(weighted[current, remaining])])
+            expected.append(current)
+            mask[current] = False
+
+        mask = np.ones(12, dtype=bool)
+        mask[0] = False
+        out = np.empty(12, dtype=np.intp)
+        last, count = _nearest_walk_kernel(weighted, mask, 0, out)
+        assert [0] + out[:count].tolist() == expected
+        assert last == expected[-1]
+        assert not mask.any()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
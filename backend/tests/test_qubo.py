@@ -2,9 +2,10 @@
 Unit tests for QUBO Builder.
 """
 
+import dimod
 import pytest
 from src.data_models import Node, Edge, CityGraph, NodeType, TrafficLevel, QUBOParams
-from src.qubo_builder import build_qubo, decode_route, validate_route, compute_route_metrics, count_priority_violations
+from src.qubo_builder import build_qubo, decode_route, decode_sampleset, validate_route, compute_route_metrics, count_priority_violations
 
 
 @pytest.fixture
@@ -62,6 +63,28 @@ class TestBuildQubo:
         # higher bias than in allowed position 2
         assert bqm.get_linear("x_N3_0") > bqm.get_linear("x_N3_2")
 
+    def test_repeat_builds_return_independent_bqms(self, simple_graph):
+        """Cached builds should match but never share the returned BQM."""
+        first = build_qubo(simple_graph)
+        first.add_linear("x_N1_0", 1e6)
+        second = build_qubo(simple_graph.model_copy(deep=True))
+        assert second is not first
+        assert second.get_linear("x_N1_0") == pytest.approx(first.get_linear("x_N1_0") - 1e6)
+
+    def test_cache_follows_params(self, simple_graph):
+        """The same graph with different penalties should give different QUBOs."""
+        default = build_qubo(simple_graph, QUBOParams())
+        scaled = build_qubo(simple_graph, QUBOParams(A=200.0))
+        assert scaled.get_linear("x_N4_3") != default.get_linear("x_N4_3")
+        assert build_qubo(simple_graph, QUBOParams()).get_linear("x_N4_3") == default.get_linear("x_N4_3")
+
+    def test_cache_follows_graph_content(self, simple_graph):
+        """A changed edge should produce a different QUBO."""
+        before = build_qubo(simple_graph)
+        edges = [e.model_copy(update={"distance": 5.0}) if e.to_node == "N2" else e for e in simple_graph.edges]
+        after = build_qubo(simple_graph.model_copy(update={"edges": edges}))
+        assert after.get_quadratic("x_N1_0", "x_N2_1") != before.get_quadratic("x_N1_0", "x_N2_1")
+
 
 class TestDecodeRoute:
     """Tests for route decoding."""
@@ -88,6 +111,23 @@ class TestDecodeRoute:
         route = decode_route(sample, ["N1", "N2", "N3", "N4"])
         assert route == ["N4", "N3", "N2", "N1"]
 
+    def test_decode_sampleset_matches_decode_route(self):
+        """decode_sampleset should give decode_route's routes, lowest energy first."""
+        forward = {f"x_N{i}_{p}": int(i - 1 == p) for i in range(1, 5) for p in range(4)}
+        reverse = {f"x_N{i}_{p}": int(4 - i == p) for i in range(1, 5) for p in range(4)}
+        partial = {var: 0 for var in forward} | {"x_N2_0": 1, "x_N3_0": 1}
+        sampleset = dimod.SampleSet.from_samples(
+            [forward, reverse, partial], vartype="BINARY", energy=[3.0, -1.0, 2.0]
+        )
+        node_ids = ["N1", "N2", "N3", "N4"]
+
+        decoded = decode_sampleset(sampleset, node_ids, depot_id="D0")
+
+        assert [energy for _, energy in decoded] == [-1.0, 2.0, 3.0]
+        assert [route for route, _ in decoded] == [
+            decode_route(sample, node_ids, depot_id="D0") for sample in (reverse, partial, forward)
+        ]
+
 
 class TestValidateRoute:
     """Tests for route validation."""
@@ -135,6 +175,57 @@ class TestComputeRouteMetrics:
         assert travel_time == pytest.approx(3.0)  # 2.0 * 1.5
 
 
+class TestEdgeWeight:
+    """Tests for CityGraph.get_edge_weight."""
+
+    def test_edge_weight_both_directions(self, simple_graph):
+        """Edges should be undirected and traffic-weighted."""
+        assert simple_graph.get_edge_weight("N2", "N4") == pytest.approx(2.82)
+        assert simple_graph.get_edge_weight("N4", "N2") == pytest.approx(2.82)
+
+    def test_edge_weight_euclidean_fallback(self, simple_graph):
+        """Pairs without an edge should use straight-line distance."""
+        assert simple_graph.get_edge_weight("N1", "N4") == pytest.approx(8 ** 0.5)
+        assert simple_graph.get_edge_weight("N1", "missing") == float("inf")
+
+    def test_edge_weight_follows_reassigned_edges(self, simple_graph):
+        """The cached index should be rebuilt when edges change."""
+        simple_graph.get_edge_weight("N1", "N2")
+        updated = simple_graph.model_copy(update={"edges": simple_graph.edges[1:]})
+        assert updated.get_edge_weight("N1", "N2") == pytest.approx(2 ** 0.5)
+        assert simple_graph.get_edge_weight("N1", "N2") == pytest.approx(1.41)
+
+    def test_edge_weight_follows_updated_multipliers(self, simple_graph):
+        """The cached index should be rebuilt when traffic multipliers change."""
+        assert simple_graph.get_edge_weight("N1", "N3") == pytest.approx(3.0)
+        simple_graph.traffic_multipliers["medium"] = 3.0
+        assert simple_graph.get_edge_weight("N1", "N3") == pytest.approx(6.0)
+
+    def test_solved_graphs_compare_and_pickle(self, simple_graph):
+        """Cached lookup tables must not leak into equality or pickles."""
+        import pickle
+        other = simple_graph.model_copy(deep=True)
+        pickled_before = pickle.dumps(simple_graph)
+        compute_route_metrics(["N1", "N2", "N3", "N4"], simple_graph)
+        compute_route_metrics(["N1", "N2", "N3", "N4"], other)
+
+        assert simple_graph == other
+        assert pickle.dumps(simple_graph) == pickled_before
+        restored = pickle.loads(pickle.dumps(simple_graph))
+        assert restored == simple_graph
+        assert restored.get_edge_weight("N1", "N2") == simple_graph.get_edge_weight("N1", "N2")
+
+    def test_lookups_follow_items_replaced_in_place(self, simple_graph):
+        """Replacing a node or edge in place should rebuild the cached tables."""
+        assert simple_graph.get_edge_weight("N1", "N2") == pytest.approx(1.41)
+        simple_graph.edges[0] = simple_graph.edges[0].model_copy(update={"distance": 5.0})
+        assert simple_graph.get_edge_weight("N1", "N2") == pytest.approx(5.0)
+
+        assert simple_graph._lookups().coords[3].tolist() == [2.0, 2.0]
+        simple_graph.nodes[3] = simple_graph.nodes[3].model_copy(update={"x": 7.0})
+        assert simple_graph._lookups().coords[3].tolist() == [7.0, 2.0]
+
+
 @pytest.fixture
 def depot_graph():
     """Create a graph with a depot + 3 delivery nodes."""
@@ -0,0 +1,79 @@
+"""
+Rate Limiting Tests.
+"""
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from src.rate_limit import RateLimiter, TokenBucket
+
+
+def make_request(api_key: str = "test") -> Request:
+    """Build a minimal request carrying an X-API-Key header."""
+    return Request({
+        "type": "http",
+        "method": "POST",
+        "path": "/solve",
+        "headers": [(b"x-api-key", api_key.encode())],
+        "client": ("127.0.0.1", 1234),
+    })
+
+
+class TestTokenBucket:
+    """Tests for the token bucket."""
+
+    def test_allows_burst_up_to_capacity(self):
+        """A fresh bucket should allow `capacity` immediate takes."""
+        bucket = TokenBucket(capacity=3, rate=1.0, now=0.0)
+        assert [bucket.take(0.0) for _ in range(4)] == [True, True, True, False]
+
+    def test_refills_over_time(self):
+        """Tokens should refill at `rate` per second."""
+        bucket = TokenBucket(capacity=1, rate=0.5, now=0.0)
+        assert bucket.take(0.0)
+        assert not bucket.take(1.0)
+        assert bucket.take(2.0)
+
+    def test_refill_capped_at_capacity(self):
+        """A long idle period should not bank more than `capacity` tokens."""
+        bucket = TokenBucket(capacity=2, rate=1.0, now=0.0)
+        assert [bucket.take(100.0) for _ in range(3)] == [True, True, False]
+
+    def test_seconds_until(self):
+        """Wait time should reflect the missing fraction of a token."""
+        bucket = TokenBucket(capacity=1, rate=0.5, now=0.0)
+        bucket.take(0.0)
+        assert bucket.seconds_until() == pytest.approx(2.0)
+
+
+class TestRateLimiter:
+    """Tests for the per-key rate limit dependency."""
+
+    def test_rejects_after_limit_with_retry_after(self):
+        """Exceeding the limit should raise 429 with Retry-After."""
+        limiter = RateLimiter(per_minute=2)
+        request = make_request()
+        asyncio.run(limiter(request))
+        asyncio.run(limiter(request))
+
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(limiter(request))
+
+        assert exc_info.value.status_code == 429
+        assert int(exc_info.value.headers["Retry-After"]) > 0
+
+    def test_keys_are_limited_independently(self):
+        """One key exhausting its bucket should not affect another."""
+        limiter = RateLimiter(per_minute=1)
+        asyncio.run(limiter(make_request("key-a")))
+        asyncio.run(limiter(make_request("key-b")))
+
+        with pytest.raises(HTTPException):
+            asyncio.run(limiter(make_request("key-a")))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
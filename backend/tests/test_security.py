@@ -295,6 +295,11 @@ class TestValidateGraphPathUnit:
         with pytest.raises(ValueError):
             validate_graph_path("city\ntest")
 
+    def test_trailing_newline_rejected(self):
+        """A trailing newline must not slip past the end-of-string anchor."""
+        with pytest.raises(ValueError):
+            validate_graph_path("city\n")
+
 
 class TestGraphNamePattern:
     """Tests for the GRAPH_NAME_PATTERN regex."""
@@ -378,6 +383,30 @@ class TestCORSBehavior:
         assert response.status_code == 200
         assert response.headers.get("access-control-allow-origin") == "http://localhost:5173"
 
+    def test_preflight_allows_api_key_header(self):
+        """Preflight should allow the X-API-Key header the frontend sends."""
+        response = client.options(
+            "/solve",
+            headers={
+                "Origin": "http://localhost:5173",
+                "Access-Control-Request-Method": "POST",
+                "Access-Control-Request-Headers": "content-type,x-api-key",
+            }
+        )
+        assert response.status_code == 200
+        assert response.headers.get("access-control-max-age") == "86400"
+
+    def test_preflight_rejects_undeclared_method(self):
+        """Preflight for a method the API does not use should be refused."""
+        response = client.options(
+            "/solve",
+            headers={
+                "Origin": "http://localhost:5173",
+                "Access-Control-Request-Method": "DELETE",
+            }
+        )
+        assert response.status_code == 400
+
     def test_preflight_disallowed_origin(self):
         """CORS preflight from disallowed origin should NOT return CORS headers."""
         response = client.options(
@@ -7,8 +7,15 @@ Verifies one-hot constraints, priority ordering, route completeness, and validat
 
 import pytest
 from src.data_models import Node, Edge, CityGraph, NodeType, TrafficLevel, QUBOParams
-from src.qubo_builder import build_qubo, decode_route, validate_route
-from src.qaoa_solver import MockSampler, quantum_solve
+from src.qubo_builder import (
+    build_qubo,
+    build_qubo_skeleton,
+    apply_penalties,
+    decode_route,
+    validate_route,
+)
+from src.qaoa_solver import MockSampler, quantum_solve, quantum_solve_batch
+from src.greedy_solver import greedy_priority_solve
 
 
 # =============================================================================
@@ -318,6 +325,46 @@ class TestMockSamplerDeterminism:
         assert result.energy is not None
         assert result.energy < float('inf')
 
+    def test_rng_matches_seeded_global_random(self, large_graph):
+        """A seeded rng should reproduce a global-seeded solve without touching global state."""
+        import random
+        random.seed(7)
+        expected = quantum_solve(large_graph, use_mock=True)
+
+        state = random.getstate()
+        actual = quantum_solve(large_graph, use_mock=True, rng=random.Random(7))
+
+        assert actual.route == expected.route
+        assert actual.energy == expected.energy
+        assert random.getstate() == state
+
+    def test_compiled_read_matches_numpy_read(self, small_graph, monkeypatch):
+        """The (Numba) kernel read should pick the same sample as the NumPy loop."""
+        import src.qaoa_solver as qaoa_solver
+
+        bqm = build_qubo(small_graph)
+        monkeypatch.setattr(qaoa_solver, "TABU_AVAILABLE", False)
+        monkeypatch.setattr(qaoa_solver, "NUMBA_AVAILABLE", False)
+        expected = MockSampler().sample(bqm, num_reads=1).first
+        monkeypatch.setattr(qaoa_solver, "NUMBA_AVAILABLE", True)
+        actual = MockSampler().sample(bqm, num_reads=1).first
+
+        assert actual.sample == expected.sample
+        assert actual.energy == expected.energy
+
+    def test_tabu_refinement_never_worse_than_greedy(self, small_graph, monkeypatch):
+        """With dwave-tabu installed, each read should end at or below its greedy start."""
+        pytest.importorskip("tabu")
+        import src.qaoa_solver as qaoa_solver
+
+        bqm = build_qubo(small_graph)
+        monkeypatch.setattr(qaoa_solver, "TABU_AVAILABLE", False)
+        greedy = MockSampler().sample(bqm, num_reads=1).first
+        monkeypatch.setattr(qaoa_solver, "TABU_AVAILABLE", True)
+        refined = MockSampler().sample(bqm, num_reads=1).first
+
+        assert refined.energy <= greedy.energy
+
 
 # =============================================================================
 # Route Validation Edge Cases
@@ -479,5 +526,129 @@ class TestAutoTuneQUBOParams:
         assert result.priority_satisfied is True
 
 
+# =============================================================================
+# Batched Solving Over Parameter Sets
+# =============================================================================
+
+class TestQuantumSolveBatch:
+    """Tests for skeleton-based QUBO reuse across parameter sets."""
+
+    def test_apply_penalties_matches_build_qubo(self, small_graph):
+        """Skeleton + coefficients should give the same QUBO as build_qubo."""
+        params = QUBOParams(A=50, B=0, Bp=300, C=2.5)
+        combined = apply_penalties(build_qubo_skeleton(small_graph), params)
+        direct = build_qubo(small_graph, params)
+
+        assert list(combined.variables) == list(direct.variables)
+        for v in direct.variables:
+            assert combined.get_linear(v) == pytest.approx(direct.get_linear(v))
+        for (u, v), bias in direct.quadratic.items():
+            assert combined.get_quadratic(u, v) == pytest.approx(bias)
+        assert combined.offset == pytest.approx(direct.offset)
+
+    def test_apply_penalties_leaves_skeleton_unchanged(self, small_graph):
+        """Applying coefficients must not mutate the shared skeleton."""
+        skeleton = build_qubo_skeleton(small_graph)
+        before = skeleton["A"].copy()
+        apply_penalties(skeleton, QUBOParams(A=7, B=1, Bp=1, C=1))
+
+        assert skeleton["A"] == before
+
+    def test_batch_returns_one_result_per_params(self, small_graph):
+        """Batch solve should return results in params order."""
+        params_list = [QUBOParams(), None, QUBOParams(C=5.0)]
+        results = quantum_solve_batch(small_graph, params_list, use_mock=True)
+
+        assert len(results) == len(params_list)
+        assert all(r.feasible for r in results)
+
+    def test_batch_matches_single_solve(self, small_graph):
+        """Deterministic first read should match an individual solve."""
+        params = QUBOParams()
+        [batched] = quantum_solve_batch(small_graph, [params], use_mock=True)
+        single = quantum_solve(small_graph, params, use_mock=True)
+
+        assert batched.route == single.route
+
+
+class TestClassicalShortcut:
+    """Tests for the no-priority shortcut in quantum_solve."""
+
+    @pytest.fixture
+    def normal_graph(self):
+        """5 normal nodes and a depot, fully connected."""
+        nodes = [Node(id="D0", x=0, y=0, type=NodeType.DEPOT)] + [
+            Node(id=f"N{i}", x=i, y=i % 2, type=NodeType.NORMAL) for i in range(1, 6)
+        ]
+        edges = [
+            Edge(from_node=a.id, to_node=b.id, distance=abs(a.x - b.x) + abs(a.y - b.y) + 0.5,
+                 traffic=TrafficLevel.LOW)
+            for a in nodes for b in nodes if a.id != b.id
+        ]
+        return CityGraph(nodes=nodes, edges=edges)
+
+    def test_no_priority_graph_skips_qubo(self, normal_graph):
+        """A graph without priority nodes should be routed classically."""
+        result = quantum_solve(normal_graph, use_mock=True)
+
+        assert result.solver_used == "quantum (classical-shortcut)"
+        assert result.energy is None
+        assert result.feasible
+        assert result.route == greedy_priority_solve(normal_graph).route
+
+    def test_batch_uses_shortcut(self, normal_graph):
+        """Batch solves of a no-priority graph should match the single solve."""
+        results = quantum_solve_batch(normal_graph, [QUBOParams(), None], use_mock=True)
+        single = quantum_solve(normal_graph, use_mock=True)
+
+        assert [r.route for r in results] == [single.route, single.route]
+        assert all(r.solver_used == single.solver_used for r in results)
+
+
+
+# =============================================================================
+# Random City Generation
+# =============================================================================
+
+class TestGenerateRandomCity:
+    """Tests for seeded graph generation."""
+
+    def test_seed_is_reproducible(self):
+        """The same seed should generate the same graph."""
+        from src.simulator import generate_random_city
+        assert generate_random_city(n_nodes=8, seed=3) == generate_random_city(n_nodes=8, seed=3)
+
+    def test_rng_matches_seed(self):
+        """Passing a seeded generator should match passing the seed."""
+        import random
+        from src.simulator import generate_random_city
+        graph = generate_random_city(n_nodes=8, rng=random.Random(3))
+        assert graph == generate_random_city(n_nodes=8, seed=3)
+
+    def test_experiment_seed_is_stable(self):
+        """Experiment seeds should not depend on hash randomization."""
+        import zlib
+        from src.simulator import experiment_seed
+        assert experiment_seed(10, "mixed", 2) == zlib.crc32(b"10|mixed|2") % (2**31)
+        assert experiment_seed(10, "mixed", 2) != experiment_seed(10, "mixed", 3)
+
+    def test_global_random_state_untouched(self):
+        """Generation should not reseed the global random module."""
+        import random
+        from src.simulator import generate_random_city
+        state = random.getstate()
+        generate_random_city(n_nodes=8, seed=3)
+        assert random.getstate() == state
+
+    def test_unseeded_follows_global_random(self):
+        """Without seed or rng, seeding the global random module should reproduce the graph."""
+        import random
+        from src.simulator import generate_random_city
+        random.seed(11)
+        first = generate_random_city(n_nodes=8)
+        random.seed(11)
+        assert generate_random_city(n_nodes=8) == first
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -14,7 +14,7 @@ from dataclasses import dataclass, field
 
 from src.data_models import QUBOParams, CityGraph
 from src.simulator import generate_random_city
-from src.qaoa_solver import quantum_solve
+from src.qaoa_solver import quantum_solve_batch
 from src.greedy_solver import greedy_solve
 from src.metrics import compute_distance_reduction, compute_time_reduction
 
@@ -82,46 +82,75 @@ def evaluate_params(
     Returns:
         TuningResult with aggregated metrics
     """
-    feasible_count = 0
-    priority_count = 0
-    distance_reductions = []
-    time_reductions = []
-    solve_times = []
-    
-    for graph in graphs:
+    return evaluate_param_grid([params], graphs, use_mock)[0]
+
+
+def evaluate_param_grid(
+    params_list: list[QUBOParams],
+    graphs: list[CityGraph],
+    use_mock: bool = True
+) -> list[TuningResult]:
+    """
+    Evaluate several parameter configurations across multiple graphs.
+
+    Loops graphs on the outside so the graph-invariant work is shared by
+    every configuration: the greedy baseline is solved once per graph, and
+    quantum_solve_batch builds the graph's QUBO skeleton once and only
+    re-weights it per configuration.
+
+    Args:
+        params_list: QUBO parameter configurations to evaluate
+        graphs: List of test graphs
+        use_mock: Use mock sampler
+
+    Returns:
+        One TuningResult per configuration, in params_list order
+    """
+    n_params = len(params_list)
+    feasible_counts = [0] * n_params
+    priority_counts = [0] * n_params
+    distance_reductions: list[list[float]] = [[] for _ in range(n_params)]
+    time_reductions: list[list[float]] = [[] for _ in range(n_params)]
+    solve_times: list[list[float]] = [[] for _ in range(n_params)]
+
+    for gi, graph in enumerate(graphs):
         try:
-            # Run quantum solver
-            quantum_result = quantum_solve(graph, params, use_mock=use_mock)
-            
-            if quantum_result.feasible:
-                feasible_count += 1
-            if quantum_result.priority_satisfied:
-                priority_count += 1
-            
-            solve_times.append(quantum_result.solve_time_ms)
-            
-            # Compare with greedy
+            # Run quantum solver for every configuration on this graph
+            quantum_results = quantum_solve_batch(graph, params_list, use_mock=use_mock)
+
+            # Greedy baseline does not depend on the QUBO params
             greedy_result = greedy_solve(graph)
-            dr = compute_distance_reduction(greedy_result, quantum_result)
-            tr = compute_time_reduction(greedy_result, quantum_result)
-            
-            if quantum_result.feasible:
-                distance_reductions.append(dr)
-                time_reductions.append(tr)
-                
         except Exception as e:
-            print(f"Error with params {params}: {e}")
-    
+            print(f"Error on graph {gi}: {e}")
+            continue
+
+        for i, quantum_result in enumerate(quantum_results):
+            if quantum_result.feasible:
+                feasible_counts[i] += 1
+                distance_reductions[i].append(
+                    compute_distance_reduction(greedy_result, quantum_result)
+                )
+                time_reductions[i].append(
+                    compute_time_reduction(greedy_result, quantum_result)
+                )
+            if quantum_result.priority_satisfied:
+                priority_counts[i] += 1
+
+            solve_times[i].append(quantum_result.solve_time_ms)
+
     n = len(graphs)
-    return TuningResult(
-        params=params,
-        feasibility_rate=feasible_count / n if n > 0 else 0,
-        priority_rate=priority_count / n if n > 0 else 0,
-        avg_distance_reduction=sum(distance_reductions) / len(distance_reductions) if distance_reductions else 0,
-        avg_time_reduction=sum(time_reductions) / len(time_reductions) if time_reductions else 0,
-        avg_solve_time_ms=sum(solve_times) / len(solve_times) if solve_times else 0,
-        n_runs=n
-    )
+    return [
+        TuningResult(
+            params=params,
+            feasibility_rate=feasible_counts[i] / n if n > 0 else 0,
+            priority_rate=priority_counts[i] / n if n > 0 else 0,
+            avg_distance_reduction=sum(distance_reductions[i]) / len(distance_reductions[i]) if distance_reductions[i] else 0,
+            avg_time_reduction=sum(time_reductions[i]) / len(time_reductions[i]) if time_reductions[i] else 0,
+            avg_solve_time_ms=sum(solve_times[i]) / len(solve_times[i]) if solve_times[i] else 0,
+            n_runs=n
+        )
+        for i, params in enumerate(params_list)
+    ]
 
 
 def run_grid_search(
@@ -165,11 +194,10 @@ def run_grid_search(
     param_grid = generate_param_grid(A_values, B_values, Bp_values, C_values)
     print(f"Testing {len(param_grid)} parameter combinations...")
     
-    results = []
-    for i, params in enumerate(param_grid):
+    results = evaluate_param_grid(param_grid, graphs, use_mock)
+    for i, result in enumerate(results):
+        params = result.params
         print(f"[{i+1}/{len(param_grid)}] A={params.A}, B={params.B}, Bp={params.Bp}, C={params.C}")
-        result = evaluate_params(params, graphs, use_mock)
-        results.append(result)
         print(f"  → Score: {result.score:.1f}, Feasibility: {result.feasibility_rate*100:.0f}%")
     
     # Sort by score (best first)
@@ -265,11 +293,12 @@ def run_ablation_study(
         for i in range(n_graphs)
     ]
     
-    results = {}
-    for name, params in ablations.items():
-        print(f"\nEvaluating: {name}")
-        result = evaluate_params(params, graphs, use_mock)
-        results[name] = result
+    results = dict(zip(
+        ablations,
+        evaluate_param_grid(list(ablations.values()), graphs, use_mock)
+    ))
+    for name, result in results.items():
+        print(f"\n{name}")
         print(f"  Score: {result.score:.1f}, Feasibility: {result.feasibility_rate*100:.0f}%")
     
     # Save results